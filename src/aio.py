@@ -0,0 +1,80 @@
+"""
+Non-blocking file I/O for the asyncio main loop.
+
+Blocking reads and writes are dispatched to the default executor, so a
+scene can await them, or spawn a task that does, while frames keep
+presenting on time.
+"""
+
+import asyncio
+from collections.abc import Callable, Coroutine
+
+from utils import load_jsonc, write_atomic
+
+# Running background tasks, referenced so they are not garbage collected
+tasks: set[asyncio.Task] = set()
+# Exceptions raised by background tasks, reraised by the main loop
+failures: list[BaseException] = []
+
+
+def run_io(func: Callable, *args) -> asyncio.Future:
+    """Return a future of func(*args) running on the default executor."""
+    return asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+
+async def read_bytes(filepath: str) -> bytes:
+    """Read a whole file."""
+
+    def read() -> bytes:
+        with open(filepath, "rb") as f:
+            return f.read()
+
+    return await run_io(read)
+
+
+async def write_bytes(filepath: str, data: bytes):
+    """Atomically replace a file with data."""
+    await run_io(write_atomic, filepath, data)
+
+
+async def read_jsonc(filepath: str) -> dict:
+    """Read and parse a jsonc file."""
+    return await run_io(load_jsonc, filepath)
+
+
+def spawn(coro: Coroutine) -> asyncio.Task:
+    """
+    Run a coroutine in the background of the asyncio main loop.
+
+    Exceptions it raises are collected in failures instead of being lost.
+    """
+    try:
+        task = asyncio.get_running_loop().create_task(coro)
+    except RuntimeError:
+        coro.close()
+        raise RuntimeError("Background tasks need the asyncio main loop.") from None
+
+    tasks.add(task)
+    task.add_done_callback(finish)
+    return task
+
+
+def finish(task: asyncio.Task):
+    """Forget a finished background task, keeping its exception if any."""
+    tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        failures.append(task.exception())
+
+
+def check_failures():
+    """Reraise the first exception raised by a background task."""
+    if failures:
+        exception = failures.pop(0)
+        failures.clear()
+        raise exception
+
+
+async def wait_all():
+    """Wait for every background task, so pending writes are not lost."""
+    while tasks:
+        await asyncio.gather(*tasks, return_exceptions=True)
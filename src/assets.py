@@ -0,0 +1,152 @@
+"""Background loading of images, fonts and data files."""
+
+import io
+import os
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+
+import pygame
+
+from fonts import FontRegistry
+from utils import load_jsonc_cached
+
+
+@dataclass(frozen=True)
+class Asset:
+    """An entry of an asset manifest."""
+
+    kind: str
+    path: str
+    size: int = 0
+
+
+def read_asset(asset: Asset):
+    """Do the disk I/O and decoding of an asset on the worker thread."""
+    if asset.kind == "image":
+        return pygame.image.load(asset.path)
+    if asset.kind == "font":
+        path = asset.path
+        if not os.path.exists(path) and path == pygame.font.get_default_font():
+            path = os.path.join(os.path.dirname(pygame.__file__), path)
+        with open(path, "rb") as f:
+            return f.read()
+    if asset.kind == "data":
+        return load_jsonc_cached(asset.path)
+    raise ValueError(f'Invalid asset kind "{asset.kind}"')
+
+
+def finish_asset(asset: Asset, loaded):
+    """Finish loading an asset on the main thread."""
+    if asset.kind == "image":
+        if pygame.display.get_surface() is not None:
+            return loaded.convert_alpha()
+        return loaded
+    if asset.kind == "font":
+        font = pygame.font.Font(io.BytesIO(loaded), asset.size)
+        FontRegistry.add(font, asset.path, asset.size)
+        return font
+    return loaded
+
+
+class AssetManager:
+    """
+    Reference counted cache of assets loaded on a worker thread.
+
+    Manifests are acquired before they are needed and released once they
+    are not. Disk I/O and decoding happen on the worker thread, and poll,
+    called once per frame, finishes loaded assets on the main thread and
+    runs the callbacks of manifests that became ready.
+    """
+
+    executor: ThreadPoolExecutor = None
+    assets: dict[Asset, object] = {}
+    counts: dict[Asset, int] = {}
+    pending: dict[Asset, Future] = {}
+    waiting: list[tuple[tuple[Asset, ...], Callable]] = []
+
+    @classmethod
+    def acquire(cls, manifest: Iterable[Asset], on_ready: Callable = None):
+        """
+        Start loading a manifest and hold a reference to each of its assets.
+
+        on_ready is called from poll once every asset is loaded, or right
+        away if they already are.
+        """
+        manifest = tuple(manifest)
+        for asset in manifest:
+            cls.counts[asset] = cls.counts.get(asset, 0) + 1
+            if asset not in cls.assets and asset not in cls.pending:
+                if cls.executor is None:
+                    cls.executor = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix="assets"
+                    )
+                cls.pending[asset] = cls.executor.submit(read_asset, asset)
+
+        if on_ready is not None:
+            if cls.is_ready(manifest):
+                on_ready()
+            else:
+                cls.waiting.append((manifest, on_ready))
+
+    @classmethod
+    def release(cls, manifest: Iterable[Asset]):
+        """Drop a reference to each asset, unloading those no longer used."""
+        for asset in manifest:
+            count = cls.counts.get(asset, 0) - 1
+            if count > 0:
+                cls.counts[asset] = count
+                continue
+
+            cls.counts.pop(asset, None)
+            cls.assets.pop(asset, None)
+            future = cls.pending.pop(asset, None)
+            if future is not None:
+                future.cancel()
+
+    @classmethod
+    def poll(cls):
+        """Finish loaded assets and call back manifests that are ready."""
+        for asset, future in list(cls.pending.items()):
+            if future.done():
+                del cls.pending[asset]
+                cls.assets[asset] = finish_asset(asset, future.result())
+
+        if cls.waiting:
+            waiting = cls.waiting
+            cls.waiting = []
+            for manifest, on_ready in waiting:
+                if cls.is_ready(manifest):
+                    on_ready()
+                else:
+                    cls.waiting.append((manifest, on_ready))
+
+    @classmethod
+    def is_ready(cls, manifest: Iterable[Asset]) -> bool:
+        """Return whether every asset of a manifest is loaded."""
+        return all(asset in cls.assets for asset in manifest)
+
+    @classmethod
+    def progress(cls, manifest: Iterable[Asset]) -> float:
+        """Return the fraction of a manifest that is loaded."""
+        manifest = tuple(manifest)
+        if not manifest:
+            return 1
+        return sum(asset in cls.assets for asset in manifest) / len(manifest)
+
+    @classmethod
+    def get(cls, asset: Asset):
+        """Return a loaded asset."""
+        loaded = cls.assets.get(asset)
+        if loaded is None:
+            raise RuntimeError(f"{asset} is not loaded.")
+        return loaded
+
+    @classmethod
+    def shutdown(cls):
+        """Stop the worker thread, abandoning anything not yet loaded."""
+        if cls.executor is not None:
+            cls.executor.shutdown(wait=False, cancel_futures=True)
+            cls.executor = None
+        cls.pending.clear()
+        cls.waiting.clear()
@@ -0,0 +1,253 @@
+"""
+Battle resolution, independent of rendering.
+
+Also runs as a balancing tool that simulates many battles between
+naturally generated parts and prints win rates and turn counts as JSON.
+
+Usage: python src/battle.py PLAYER_PART ENEMY_PART [--battles N]
+       [--player-titles TITLE ...] [--enemy-titles TITLE ...]
+       [--max-turns N] [--seed N]
+"""
+
+import argparse
+import json
+import random
+import statistics
+from array import array
+from collections import Counter
+from collections.abc import Sequence
+from dataclasses import dataclass
+from itertools import compress, islice, repeat
+from operator import add, mul, not_, sub
+
+from monster import Monster
+from parts import Part
+from partstore import PartStore
+
+# Damage is scaled by a uniform roll in this range
+DAMAGE_ROLL = (0.85, 1.15)
+# Defending multiplies defense against the next hit
+DEFEND_MULTIPLIER = 2
+# Chance that running away succeeds
+RUN_CHANCE = 0.5
+
+
+def damage(attack: float, defense: float, roll: float) -> float:
+    """Return the damage of an attack against a defense."""
+    if attack <= 0:
+        return 0
+    return attack * attack / (attack + max(defense, 0)) * roll
+
+
+@dataclass
+class Combatant:
+    """Battle stats of one side."""
+
+    name: str
+    health: float
+    health_max: float
+    defense: float
+    attack: float
+    defending: bool = False
+
+    @classmethod
+    def from_part(cls, name: str, part: Part) -> "Combatant":
+        """Return a combatant with the stats of a single part."""
+        return cls(name, part.health, part.health, part.defense, part.attack)
+
+    @classmethod
+    def from_monster(cls, name: str, monster: Monster) -> "Combatant":
+        """Return a combatant with the total stats of a monster."""
+        return cls(
+            name, monster.health, monster.health, monster.defense, monster.attack
+        )
+
+    @property
+    def is_alive(self) -> bool:
+        """Return whether the combatant still has health."""
+        return self.health > 0
+
+
+class Battle:
+    """
+    A turn based battle between the player and an enemy.
+
+    Each turn the player picks an action, then the enemy attacks if the
+    battle is not over.
+    """
+
+    actions = ("attack", "defend", "run")
+
+    def __init__(self, player: Combatant, enemy: Combatant, rng: random.Random = None):
+        """Instantiate Battle."""
+        self.player = player
+        self.enemy = enemy
+        self.rng = rng or random.Random()
+        self.turn = 0
+        self.winner: Combatant = None
+        self.escaped = False
+        self.log: list[str] = []
+
+    @property
+    def is_over(self) -> bool:
+        """Return whether the battle has ended."""
+        return self.winner is not None or self.escaped
+
+    def strike(self, attacker: Combatant, defender: Combatant):
+        """Resolve one attack."""
+        defense = defender.defense
+        if defender.defending:
+            defense *= DEFEND_MULTIPLIER
+            defender.defending = False
+
+        dealt = damage(attacker.attack, defense, self.rng.uniform(*DAMAGE_ROLL))
+        defender.health = max(defender.health - dealt, 0)
+        self.log.append(f"{attacker.name} hits {defender.name} for {dealt:.0f}.")
+
+        if not defender.is_alive:
+            self.winner = attacker
+            self.log.append(f"{defender.name} is defeated!")
+
+    def player_turn(self, action: str):
+        """Resolve the player's action followed by the enemy's response."""
+        if self.is_over:
+            return
+        if action not in self.actions:
+            raise ValueError(f'Invalid battle action "{action}"')
+
+        self.turn += 1
+        if action == "attack":
+            self.strike(self.player, self.enemy)
+        elif action == "defend":
+            self.player.defending = True
+            self.log.append(f"{self.player.name} defends.")
+        elif self.rng.random() < RUN_CHANCE:
+            self.escaped = True
+            self.log.append(f"{self.player.name} got away!")
+            return
+        else:
+            self.log.append(f"{self.player.name} couldn't get away!")
+
+        if not self.is_over:
+            self.strike(self.enemy, self.player)
+
+
+def simulate_batch(
+    player: Sequence[Sequence[float]],
+    enemy: Sequence[Sequence[float]],
+    max_turns: int = 100,
+    rng: random.Random = None,
+) -> tuple[array, array]:
+    """
+    Simulate independent battles where both sides always attack.
+
+    player and enemy are (health, defense, attack) columns with one entry
+    per battle. Every turn resolves all unfinished battles as whole column
+    operations with map, the damage rolls included, and then compacts the
+    columns down to the battles still going. Return the winners (1 for
+    the player, -1 for the enemy and 0 for a draw at max_turns) and the
+    number of turns of each battle.
+    """
+    rng = rng or random.Random()
+    low, high = DAMAGE_ROLL
+
+    def hit_columns(attack: Sequence[float], defense: Sequence[float]) -> tuple:
+        # A hit deals base * roll, with roll = low + (high - low) * random()
+        base = list(map(damage, attack, defense, repeat(1.0)))
+        return list(map(low.__mul__, base)), list(map((high - low).__mul__, base))
+
+    def strike(health: list, hit_low: list, hit_span: list) -> list:
+        rolls = islice(iter(rng.random, None), len(health))
+        hits = map(add, hit_low, map(mul, hit_span, rolls))
+        return list(map(sub, health, hits))
+
+    def finish(columns: tuple, health: list, winner: int, turn: int) -> tuple:
+        # Record the battles whose health column hit zero and drop them
+        defeated = list(map((0.0).__ge__, health))
+        if not any(defeated):
+            return columns
+        for index in compress(columns[0], defeated):
+            winners[index] = winner
+            turns[index] = turn
+        going = list(map(not_, defeated))
+        return tuple(list(compress(column, going)) for column in columns)
+
+    n = len(player[0])
+    winners = array("b", [0]) * n
+    turns = array("H", [max_turns]) * n
+
+    # Battle index, player and enemy health, then the player's and the
+    # enemy's hit columns, for every battle still going. Lists rather than
+    # arrays, since they are rebuilt as battles finish
+    columns = (
+        list(range(n)),
+        list(player[0]),
+        list(enemy[0]),
+        *hit_columns(player[2], enemy[1]),
+        *hit_columns(enemy[2], player[1]),
+    )
+
+    for turn in range(1, max_turns + 1):
+        index, player_health, enemy_health, *hits = columns
+        enemy_health = strike(enemy_health, hits[0], hits[1])
+        columns = (index, player_health, enemy_health, *hits)
+        columns = finish(columns, enemy_health, 1, turn)
+
+        index, player_health, enemy_health, *hits = columns
+        player_health = strike(player_health, hits[2], hits[3])
+        columns = (index, player_health, enemy_health, *hits)
+        columns = finish(columns, player_health, -1, turn)
+
+        if not columns[0]:
+            break
+
+    return winners, turns
+
+
+def main():
+    """Simulate battles between generated parts and print a report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("player")
+    parser.add_argument("enemy")
+    parser.add_argument("--battles", type=int, default=10000)
+    parser.add_argument("--player-titles", nargs="*", default=[])
+    parser.add_argument("--enemy-titles", nargs="*", default=[])
+    parser.add_argument("--max-turns", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+    if args.battles < 2:
+        parser.error("--battles must be at least 2")
+
+    random.seed(args.seed)
+    store = PartStore()
+    players = store.factory_natural_batch(args.player, args.battles, args.player_titles)
+    enemies = store.factory_natural_batch(args.enemy, args.battles, args.enemy_titles)
+
+    def columns(indices: range) -> tuple[array, array, array]:
+        section = slice(indices.start, indices.stop)
+        return store.health[section], store.defense[section], store.attack[section]
+
+    winners, turns = simulate_batch(
+        columns(players), columns(enemies), args.max_turns, random.Random(args.seed)
+    )
+
+    results = Counter(winners)
+    quantiles = statistics.quantiles(turns, n=100, method="inclusive")
+    report = {
+        "battles": args.battles,
+        "player_win_rate": results[1] / args.battles,
+        "enemy_win_rate": results[-1] / args.battles,
+        "draw_rate": results[0] / args.battles,
+        "turns": {
+            "mean": statistics.fmean(turns),
+            "p50": quantiles[49],
+            "p95": quantiles[94],
+            "max": max(turns),
+            "histogram": dict(sorted(Counter(turns).items())),
+        },
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
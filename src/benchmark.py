@@ -0,0 +1,177 @@
+"""
+Headless frame time benchmark.
+
+Runs every scene offscreen under the SDL dummy video driver through the
+same frame path as main.main and prints frame time statistics as JSON.
+
+Usage: python src/benchmark.py [--frames N] [--warmup N] [--fps N] [scene ...]
+
+Every frame simulates 1 / FRAME_RATE seconds, however long it really
+took, so scenes animate the same in every run. Frames are unthrottled by
+default; pass --fps to pace them like the game does.
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Callable
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+# Keep stdout to the JSON results
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame  # noqa: E402
+
+from gamestate import GameState  # noqa: E402
+from hittest import HitTester  # noqa: E402
+from inputcontroller import InputController  # noqa: E402
+from main import FRAME_RATE, process_events, run_frame  # noqa: E402
+from renderer import Renderer  # noqa: E402
+from scenes.battle_scene import BattleScene  # noqa: E402
+from scenes.mg_simon import MGSIMON  # noqa: E402
+from scenes.mg_wheel import MGWheel  # noqa: E402
+from scenes.pause_screen import ControlsScreen, PauseHandler, PauseScreen  # noqa: E402
+from scenes.scene import Scene  # noqa: E402
+from scenestack import SceneStack  # noqa: E402
+from timestep import FixedTimestep  # noqa: E402
+
+
+def create_wheel(pause_handler: PauseHandler) -> Scene:
+    """Create a wheel mini game with the ball already spinning."""
+    scene = MGWheel()
+    scene.ball.clicked = True
+    return scene
+
+
+def create_pause(pause_handler: PauseHandler) -> Scene:
+    """Create a pause screen on top of a battle."""
+    game_state = GameState()
+    game_state.scene = BattleScene()
+    pause_handler.is_paused = True
+    SceneStack.push(PauseScreen("Pause", pause_handler), freeze=True)
+    return game_state.scene
+
+
+def create_controls(pause_handler: PauseHandler) -> Scene:
+    """Create a controls screen on top of the pause screen."""
+    create_pause(pause_handler)
+    SceneStack.push(ControlsScreen("Controls"), freeze=True)
+    return GameState().scene
+
+
+SCENES: dict[str, Callable[[PauseHandler], Scene]] = {
+    "BattleScene": lambda pause_handler: BattleScene(),
+    "MGWheel": create_wheel,
+    "MGSIMON": lambda pause_handler: MGSIMON(),
+    "PauseScreen": create_pause,
+    "ControlsScreen": create_controls,
+}
+
+
+def time_frames(pause_handler: PauseHandler, frames: int, fps: int) -> list[float]:
+    """Run frames and return the duration of each in milliseconds."""
+    game_state = GameState()
+
+    durations = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        process_events(pygame.event.get())
+        run_frame(pause_handler, 1 / FRAME_RATE)
+        durations.append((time.perf_counter() - start) * 1000)
+        game_state.clock.tick(fps)
+
+    return durations
+
+
+def measure_allocations(pause_handler: PauseHandler, frames: int, fps: int) -> dict:
+    """Run frames under tracemalloc and return per frame allocation figures."""
+    game_state = GameState()
+
+    peaks = []
+    blocks_start = sys.getallocatedblocks()
+    tracemalloc.start()
+    for _ in range(frames):
+        tracemalloc.reset_peak()
+        current = tracemalloc.get_traced_memory()[0]
+        process_events(pygame.event.get())
+        run_frame(pause_handler, 1 / FRAME_RATE)
+        peaks.append(tracemalloc.get_traced_memory()[1] - current)
+        game_state.clock.tick(fps)
+    tracemalloc.stop()
+    blocks_end = sys.getallocatedblocks()
+
+    return {
+        "alloc_peak_bytes_per_frame": statistics.fmean(peaks),
+        "net_blocks_per_frame": (blocks_end - blocks_start) / frames,
+    }
+
+
+def benchmark_scene(name: str, frames: int, warmup: int, fps: int) -> dict:
+    """Return frame statistics for a single scene."""
+    game_state = GameState()
+    pause_handler = PauseHandler()
+    SceneStack.clear()
+    game_state.scene = SCENES[name](pause_handler)
+    Renderer.invalidate()
+
+    time_frames(pause_handler, warmup, fps)
+    durations = time_frames(pause_handler, frames, fps)
+    quantiles = statistics.quantiles(durations, n=100, method="inclusive")
+    total = sum(durations)
+
+    result = {
+        "frames": frames,
+        "p50_ms": quantiles[49],
+        "p95_ms": quantiles[94],
+        "p99_ms": quantiles[98],
+        "max_ms": max(durations),
+        "fps": frames / total * 1000 if total else float("inf"),
+        "pixels_updated": Renderer.pixels_updated,
+    }
+    result.update(measure_allocations(pause_handler, frames, fps))
+    return result
+
+
+def main():
+    """Benchmark the requested scenes and print the results as JSON."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("scenes", nargs="*", help=", ".join(SCENES))
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--warmup", type=int, default=30)
+    parser.add_argument(
+        "--fps", type=int, default=0, help="throttle frames to N per second"
+    )
+    args = parser.parse_args()
+
+    for name in args.scenes:
+        if name not in SCENES:
+            parser.error(f'Unknown scene "{name}"')
+
+    pygame.init()
+    pygame.font.init()
+
+    game_state = GameState()
+    game_state.screen = pygame.display.set_mode((1280, 720))
+    game_state.clock = pygame.time.Clock()
+    game_state.timestep = FixedTimestep()
+    game_state.input = InputController()
+    game_state.hit_tester = HitTester()
+    game_state.rng = random.Random(0)
+
+    results = {
+        name: benchmark_scene(name, max(args.frames, 2), args.warmup, args.fps)
+        for name in args.scenes or SCENES
+    }
+    print(json.dumps(results, indent=2))
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,15 @@
 """Button Class."""
 
+from functools import partial
 from typing import Callable
 
 import pygame
 
 from gamestate import GameState
-from text import TextWrapper
+from profiler import profiled
+from renderer import Renderer
+from shapes import ShapeCache
+from text import Label
 
 
 class Button:
@@ -37,7 +41,7 @@ class Button:
         self.text_color = text_color
         self.font_name = font_name
         self.font_size = font_size
-        self.text_wrapper = TextWrapper(
+        self.text_wrapper = Label(
             text,
             (x + 10, y + h / 2 - font_size / 2, w, h),
             font_name,
@@ -45,26 +49,30 @@ class Button:
             text_color,
         )
 
+    @profiled("Button.draw")
     def draw(self):
         """Draw the button."""
         game_state = GameState()
 
         button_rect = pygame.Rect(self.x, self.y, self.w, self.h)
-        mouse_x, mouse_y = pygame.mouse.get_pos()
-        if (
-            mouse_x > self.x
-            and mouse_x < self.x + self.w
-            and mouse_y > self.y
-            and mouse_y < self.y + self.h
-        ):
-            pygame.draw.rect(
-                game_state.screen, self.color2, button_rect, border_radius=5
+        game_state.hit_tester.register_rect(self, button_rect, self.func)
+        hovered = game_state.hit_tester.is_hovered(self)
+
+        if not Renderer.is_current(self, hovered):
+            surface = ShapeCache.rect(
+                button_rect.size,
+                self.color2 if hovered else self.color1,
+                border_radius=5,
             )
-            if pygame.mouse.get_pressed()[0]:
-                self.func()
-        else:
-            pygame.draw.rect(
-                game_state.screen, self.color1, button_rect, border_radius=5
+            # Scaled corners blend with what is under them, so never overdraw
+            Renderer.erase(self)
+            game_state.screen.blit(surface, button_rect)
+            Renderer.drawn(
+                self,
+                button_rect,
+                hovered,
+                partial(game_state.screen.blit, surface, button_rect),
             )
+            Renderer.forget(self.text_wrapper)
 
         self.text_wrapper.draw()
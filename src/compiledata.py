@@ -0,0 +1,25 @@
+"""
+Compile jsonc data files into their caches ahead of time.
+
+Usage: python src/compiledata.py [file ...]
+
+Compiles every jsonc file in the data directory when no files are given.
+"""
+
+import glob
+import os
+import sys
+
+from utils import get_cache_path, load_jsonc_cached
+
+
+def main():
+    """Compile the given data files."""
+    filepaths = sys.argv[1:] or sorted(glob.glob(os.path.join(".", "data", "*.jsonc")))
+    for filepath in filepaths:
+        load_jsonc_cached(filepath)
+        print(f"{filepath} -> {get_cache_path(filepath)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,303 @@
+"""Presentation of the logical screen in a window of any size."""
+
+import math
+import weakref
+from fractions import Fraction
+
+import pygame
+
+MOUSE_EVENTS = (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP)
+
+
+# Largest block of source pixels that is aligned exactly when scaling
+MAX_BLOCK = 8
+# Source pixels around a rect that is scaled without exact alignment
+MARGIN = 2
+
+
+def align_rect(
+    rect: pygame.Rect, size: tuple[int, int], target_size: tuple[int, int]
+) -> tuple[pygame.Rect, pygame.Rect]:
+    """
+    Return the source area to scale for rect and the area it maps to.
+
+    Scaling from size to target_size maps every block of den source
+    pixels to exactly num target pixels, where num / den is the reduced
+    ratio of the sizes. When blocks are small the rect is grown to whole
+    blocks, so areas scaled separately stay on the same grid as the whole
+    screen. Otherwise the rect is grown by a margin instead, covering the
+    pixels a slightly stretched earlier scaling may have left behind.
+    """
+    source = []
+    target = []
+    for start, end, length, target_length in (
+        (rect.left, rect.right, size[0], target_size[0]),
+        (rect.top, rect.bottom, size[1], target_size[1]),
+    ):
+        ratio = Fraction(target_length, length)
+        if ratio.denominator <= MAX_BLOCK:
+            den = ratio.denominator
+            start = start // den * den
+            end = -(-end // den) * den
+        else:
+            start = max(start - MARGIN, 0)
+            end = min(end + MARGIN, length)
+        source.append((start, end - start))
+
+        target_start = start * ratio.numerator // ratio.denominator
+        target_end = -(-end * ratio.numerator // ratio.denominator)
+        target.append((target_start, target_end - target_start))
+
+    (x, w), (y, h) = source
+    (tx, tw), (ty, th) = target
+    return pygame.Rect(x, y, w, h), pygame.Rect(tx, ty, tw, th)
+
+
+def scale_surface(
+    source: pygame.Surface, size: tuple[int, int], smooth: bool
+) -> pygame.Surface:
+    """Return a copy of source scaled to size with the selected filtering."""
+    if smooth and source.get_bitsize() >= 24:
+        return pygame.transform.smoothscale(source, size)
+    return pygame.transform.scale(source, size)
+
+
+class Canvas:
+    """
+    Logical screen drawn at a reduced internal resolution.
+
+    Takes positions and rects in logical coordinates like a surface of the
+    logical size, and draws scaled copies of surfaces into a smaller
+    internal surface. Returned rects cover every internal pixel drawn to.
+
+    A surface blitted whole is taken not to change while it lives, as with
+    cached shapes, rendered text and scene backgrounds, so it is scaled
+    once. Areas of other surfaces, like text that is revealed in place,
+    are scaled on every blit.
+    """
+
+    def __init__(
+        self, logical_size: tuple[int, int], scale: float, smooth: bool = True
+    ):
+        """Create the internal surface for a logical size and scale."""
+        self.logical_size = logical_size
+        self.scale = scale
+        self.smooth = smooth
+        self.surface = pygame.Surface(self.scale_size(logical_size)).convert()
+        self.scaled = weakref.WeakKeyDictionary()
+
+    def scale_size(self, size: tuple[int, int]) -> tuple[int, int]:
+        """Return the internal size of a logical size."""
+        width, height = size
+        return max(round(width * self.scale), 1), max(round(height * self.scale), 1)
+
+    def to_internal(self, rect: pygame.Rect) -> pygame.Rect:
+        """Return the internal rect covering a logical rect."""
+        rect = pygame.Rect(rect)
+        left = math.floor(rect.left * self.scale)
+        top = math.floor(rect.top * self.scale)
+        right = math.ceil(rect.right * self.scale)
+        bottom = math.ceil(rect.bottom * self.scale)
+        return pygame.Rect(left, top, right - left, bottom - top)
+
+    def to_logical(self, rect: pygame.Rect) -> pygame.Rect:
+        """Return the logical rect covering an internal rect."""
+        left = math.floor(rect.left / self.scale)
+        top = math.floor(rect.top / self.scale)
+        right = math.ceil(rect.right / self.scale)
+        bottom = math.ceil(rect.bottom / self.scale)
+        return pygame.Rect(left, top, right - left, bottom - top)
+
+    def get_scaled(self, source: pygame.Surface) -> pygame.Surface:
+        """Return the scaled copy of a whole surface, scaling it only once."""
+        scaled = self.scaled.get(source)
+        if scaled is None:
+            scaled = self.scaled[source] = scale_surface(
+                source, self.scale_size(source.get_size()), self.smooth
+            )
+        return scaled
+
+    def blit(
+        self,
+        source: pygame.Surface,
+        dest,
+        area: pygame.Rect = None,
+        special_flags: int = 0,
+    ) -> pygame.Rect:
+        """Draw source, or an area of it, with its top left corner at dest."""
+        position = (
+            math.floor(dest[0] * self.scale),
+            math.floor(dest[1] * self.scale),
+        )
+        whole = area is None
+        area = source.get_rect() if whole else pygame.Rect(area).clip(source.get_rect())
+        if not area:
+            # Empty surfaces cannot be scaled, and would draw nothing anyway
+            return pygame.Rect(dest[0], dest[1], 0, 0)
+
+        scaled = self.scaled.get(source)
+        if whole:
+            image = self.get_scaled(source)
+        elif scaled is not None:
+            image = scaled.subsurface(self.to_internal(area).clip(scaled.get_rect()))
+        else:
+            image = scale_surface(
+                source.subsurface(area), self.scale_size(area.size), self.smooth
+            )
+        rect = self.surface.blit(image, position, special_flags=special_flags)
+        return self.to_logical(rect)
+
+    def blits(self, blit_sequence, doreturn: bool = True) -> list[pygame.Rect]:
+        """Draw a sequence of (source, dest) or (source, dest, area) blits."""
+        rects = [self.blit(*blit) for blit in blit_sequence]
+        return rects if doreturn else None
+
+    def get_size(self) -> tuple[int, int]:
+        """Return the logical size."""
+        return self.logical_size
+
+    def get_width(self) -> int:
+        """Return the logical width."""
+        return self.logical_size[0]
+
+    def get_height(self) -> int:
+        """Return the logical height."""
+        return self.logical_size[1]
+
+    def get_rect(self) -> pygame.Rect:
+        """Return the logical rect of the screen."""
+        return pygame.Rect((0, 0), self.logical_size)
+
+    def get_clip(self) -> pygame.Rect:
+        """Return the logical rect drawing is clipped to."""
+        return self.to_logical(self.surface.get_clip())
+
+    def set_clip(self, rect: pygame.Rect = None):
+        """Clip drawing to a logical rect, or to nothing with None."""
+        self.surface.set_clip(None if rect is None else self.to_internal(rect))
+
+    def copy(self) -> pygame.Surface:
+        """Return what was drawn scaled back up to a surface of logical size."""
+        return scale_surface(self.surface, self.logical_size, self.smooth)
+
+
+class Display:
+    """
+    Window that shows a fixed size logical screen.
+
+    Scenes draw into the logical screen in layout coordinates regardless
+    of the window size. When the window has the logical size and the
+    render scale is 1 the logical screen is the window itself. Otherwise
+    each frame the changed areas are scaled into the window with smooth
+    or nearest neighbour filtering. Below a render scale of 1 scenes draw
+    through a Canvas, so every drawing and the scaling into the window
+    start from fewer pixels.
+    """
+
+    logical_size: tuple[int, int] = (1280, 720)
+    window: pygame.Surface = None
+    # Surface scaled into the window, at the logical size or the canvas size
+    surface: pygame.Surface = None
+    canvas: Canvas = None
+    smooth: bool = True
+    resized: bool = False
+
+    @classmethod
+    def setup(
+        cls,
+        window_size: tuple[int, int] = None,
+        smooth: bool = True,
+        render_scale: float = 1,
+    ) -> pygame.Surface | Canvas:
+        """Open the window and return the logical screen scenes draw to."""
+        if not 0 < render_scale <= 1:
+            raise ValueError("The render scale must be above 0 and at most 1.")
+
+        cls.smooth = smooth
+        cls.canvas = None
+        window_size = tuple(window_size or cls.logical_size)
+
+        if window_size == cls.logical_size and render_scale == 1:
+            cls.window = cls.surface = pygame.display.set_mode(window_size)
+            return cls.surface
+
+        cls.window = pygame.display.set_mode(window_size, pygame.RESIZABLE)
+        cls.resized = True
+        if render_scale < 1:
+            cls.canvas = Canvas(cls.logical_size, render_scale, smooth)
+            cls.surface = cls.canvas.surface
+            return cls.canvas
+
+        cls.surface = pygame.Surface(cls.logical_size).convert()
+        return cls.surface
+
+    @classmethod
+    def is_scaled(cls) -> bool:
+        """Return whether the logical screen is presented through scaling."""
+        return cls.surface is not cls.window
+
+    @classmethod
+    def resize(cls):
+        """Pick up a new window size and present everything next frame."""
+        cls.window = pygame.display.get_surface()
+        cls.resized = True
+
+    @classmethod
+    def map_event(cls, event: pygame.event.Event) -> pygame.event.Event:
+        """Return an event with mouse positions in logical coordinates."""
+        if event.type == pygame.VIDEORESIZE and cls.is_scaled():
+            cls.resize()
+        if event.type not in MOUSE_EVENTS or not cls.is_scaled():
+            return event
+
+        x, y = event.pos
+        window_width, window_height = cls.window.get_size()
+        width, height = cls.logical_size
+        pos = (int(x * width / window_width), int(y * height / window_height))
+        return pygame.event.Event(event.type, {**event.dict, "pos": pos})
+
+    @classmethod
+    def scale(cls, source: pygame.Surface, dest: pygame.Surface):
+        """Scale source to fill dest with the selected filtering."""
+        if source.get_size() == dest.get_size():
+            dest.blit(source, (0, 0))
+        elif cls.smooth:
+            pygame.transform.smoothscale(source, dest.get_size(), dest)
+        else:
+            pygame.transform.scale(source, dest.get_size(), dest)
+
+    @classmethod
+    def present(cls, rects: list[pygame.Rect] = None):
+        """Show the given logical rects, or the whole logical screen."""
+        if not cls.is_scaled():
+            if rects is None:
+                pygame.display.update()
+            else:
+                pygame.display.update(rects)
+            return
+
+        screen_rect = cls.surface.get_rect()
+        if rects is None or cls.resized:
+            cls.resized = False
+            rects = [screen_rect]
+        elif cls.canvas is not None:
+            rects = [cls.canvas.to_internal(rect) for rect in rects]
+
+        size = cls.surface.get_size()
+        window_size = cls.window.get_size()
+        updated = []
+        for rect in rects:
+            if cls.smooth:
+                # Smooth scaling of an area stretches it by up to a pixel
+                # and blends in its neighbours, so scale a margin around it
+                # to cover what the area showed when last scaled
+                rect = rect.inflate(6, 6)
+            rect = rect.clip(screen_rect)
+            if not rect:
+                continue
+
+            rect, target = align_rect(rect, size, window_size)
+            cls.scale(cls.surface.subsurface(rect), cls.window.subsurface(target))
+            updated.append(target)
+
+        pygame.display.update(updated)
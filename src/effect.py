@@ -1,6 +1,8 @@
 """Module containing the Effect classes."""
 
 from abc import ABC, abstractmethod
+from array import array
+from collections.abc import Iterable, Sequence
 
 
 class Effect(ABC):
@@ -34,3 +36,86 @@ class ProportionalEffect(Effect):
     def apply(self, health: float, defense: float, attack: float):
         """Return a tuple of new stats."""
         return (health * self._health, defense * self._defense, attack * self._attack)
+
+
+class AffineEffect(Effect):
+    """
+    Class for effects that scale and then offset each stat.
+
+    Static and proportional effects are both affine, so any chain of them
+    folds into a single AffineEffect that is applied in one step.
+    """
+
+    def __init__(
+        self,
+        health: float = 1,
+        defense: float = 1,
+        attack: float = 1,
+        health_offset: float = 0,
+        defense_offset: float = 0,
+        attack_offset: float = 0,
+    ):
+        """Initialize AffineEffect with a scale and an offset per stat."""
+        super().__init__(health, defense, attack)
+        self._health_offset = health_offset
+        self._defense_offset = defense_offset
+        self._attack_offset = attack_offset
+
+    @classmethod
+    def compile(cls, effects: Iterable[Effect]) -> "AffineEffect":
+        """Fold a chain of effects, applied in order, into one effect."""
+        compiled = cls()
+        for effect in effects:
+            compiled = compiled.then(effect)
+        return compiled
+
+    def then(self, effect: Effect) -> "AffineEffect":
+        """Return an effect equal to applying this effect and then another."""
+        if isinstance(effect, StaticEffect):
+            scale = (1, 1, 1)
+            offset = (effect._health, effect._defense, effect._attack)
+        elif isinstance(effect, ProportionalEffect):
+            scale = (effect._health, effect._defense, effect._attack)
+            offset = (0, 0, 0)
+        elif isinstance(effect, AffineEffect):
+            scale = (effect._health, effect._defense, effect._attack)
+            offset = (
+                effect._health_offset,
+                effect._defense_offset,
+                effect._attack_offset,
+            )
+        else:
+            raise TypeError(f'Cannot compile effect "{type(effect).__name__}"')
+
+        return AffineEffect(
+            self._health * scale[0],
+            self._defense * scale[1],
+            self._attack * scale[2],
+            self._health_offset * scale[0] + offset[0],
+            self._defense_offset * scale[1] + offset[1],
+            self._attack_offset * scale[2] + offset[2],
+        )
+
+    def apply(self, health: float, defense: float, attack: float):
+        """Return a tuple of new stats."""
+        return (
+            health * self._health + self._health_offset,
+            defense * self._defense + self._defense_offset,
+            attack * self._attack + self._attack_offset,
+        )
+
+    def apply_batch(
+        self,
+        health: Sequence[float],
+        defense: Sequence[float],
+        attack: Sequence[float],
+    ) -> tuple[array, array, array]:
+        """Return arrays of new stats for columns of stats."""
+        health_scale, health_offset = self._health, self._health_offset
+        defense_scale, defense_offset = self._defense, self._defense_offset
+        attack_scale, attack_offset = self._attack, self._attack_offset
+        return (
+            array("d", [h * health_scale + health_offset for h in health]),
+            array("d", [d * defense_scale + defense_offset for d in defense]),
+            array("d", [a * attack_scale + attack_offset for a in attack]),
+        )
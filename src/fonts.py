@@ -0,0 +1,86 @@
+"""Process-wide registry of loaded fonts."""
+
+from collections import OrderedDict
+
+import pygame
+
+
+class FontRegistry:
+    """
+    Shared cache of fonts keyed by (name, size, style).
+
+    Fonts are kept in least-recently-used order and the oldest entry is
+    evicted once the registry holds more than max_size fonts.
+    """
+
+    max_size: int = 32
+    fonts: OrderedDict = OrderedDict()
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @classmethod
+    def get(
+        cls,
+        font_name: str = "freesansbold.ttf",
+        font_size: float = 20,
+        bold: bool = False,
+        italic: bool = False,
+    ) -> pygame.font.Font:
+        """Return a shared font, loading it on first use."""
+        key = (font_name, font_size, bold, italic)
+
+        font = cls.fonts.get(key)
+        if font is not None:
+            cls.hits += 1
+            cls.fonts.move_to_end(key)
+            return font
+
+        cls.misses += 1
+        font = pygame.font.Font(font_name, int(font_size))
+        font.set_bold(bold)
+        font.set_italic(italic)
+        cls.fonts[key] = font
+
+        while len(cls.fonts) > cls.max_size:
+            cls.fonts.popitem(last=False)
+            cls.evictions += 1
+
+        return font
+
+    @classmethod
+    def add(
+        cls,
+        font: pygame.font.Font,
+        font_name: str = "freesansbold.ttf",
+        font_size: float = 20,
+        bold: bool = False,
+        italic: bool = False,
+    ):
+        """Add a font that was loaded elsewhere so get returns it."""
+        font.set_bold(bold)
+        font.set_italic(italic)
+        cls.fonts[(font_name, font_size, bold, italic)] = font
+
+        while len(cls.fonts) > cls.max_size:
+            cls.fonts.popitem(last=False)
+            cls.evictions += 1
+
+    @classmethod
+    def stats(cls) -> dict:
+        """Return hit, miss and eviction counts along with the current size."""
+        return {
+            "hits": cls.hits,
+            "misses": cls.misses,
+            "evictions": cls.evictions,
+            "size": len(cls.fonts),
+            "max_size": cls.max_size,
+        }
+
+    @classmethod
+    def clear(cls):
+        """Drop every cached font and reset the counters."""
+        cls.fonts.clear()
+        cls.hits = 0
+        cls.misses = 0
+        cls.evictions = 0
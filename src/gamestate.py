@@ -1,8 +1,13 @@
 """GameState singleton class."""
 
+import random
+
 import pygame
 
+from hittest import HitTester
+from inputcontroller import InputController
 from scenes.scene import Scene
+from timestep import FixedTimestep
 
 singleton = None
 
@@ -10,10 +15,17 @@ singleton = None
 class GameState:
     """GameState class."""
 
+    # A Canvas with the same drawing methods at reduced render scales
     screen: pygame.Surface
     scene: Scene
     clock: pygame.time.Clock
-    key_press: str = None
+    timestep: FixedTimestep
+    input: InputController
+    hit_tester: HitTester
+    # Source of randomness for the session, seeded so replays match
+    rng: random.Random
+    # Whether the next frame would draw exactly what is on screen
+    idle: bool = False
 
     def __new__(cls):
         """Generate singleton object."""
@@ -0,0 +1,162 @@
+"""Central mouse hit testing for clickable objects."""
+
+from dataclasses import dataclass, field
+from typing import Callable
+
+import pygame
+
+
+@dataclass(eq=False)
+class HitTarget:
+    """A clickable shape registered by an object."""
+
+    owner: object
+    on_click: Callable
+    rect: pygame.Rect
+    circle: tuple[float, float, float] = None
+    order: int = 0
+    seen: int = 0
+    cells: list[tuple[int, int]] = field(default_factory=list)
+
+    def contains(self, x: float, y: float) -> bool:
+        """Return whether the point lies inside the shape."""
+        if self.circle is not None:
+            cx, cy, radius = self.circle
+            return (x - cx) ** 2 + (y - cy) ** 2 <= radius**2
+        return self.rect.collidepoint(x, y)
+
+
+class HitTester:
+    """
+    Mouse hit testing over a uniform grid.
+
+    Objects register their shapes while drawing each frame and anything
+    not registered during the previous frame is dropped. Every target is
+    dropped as soon as the active scene changes, so a scene that was just
+    left or covered never takes another click. Mouse events are
+    handled once per frame; hover is looked up through the grid cell under
+    the cursor and each press is dispatched once, to the topmost target.
+    """
+
+    def __init__(self, cell_size: int = 64):
+        """Initialize the hit tester."""
+        self.cell_size = cell_size
+        self.grid: dict[tuple[int, int], list[HitTarget]] = {}
+        self.targets: dict[object, HitTarget] = {}
+        self.frame = 0
+        self.draw_order = 0
+        self.mouse_pos = pygame.mouse.get_pos()
+        self.presses: list[tuple[int, int]] = []
+        self.hovered: HitTarget = None
+        # Scene the targets were registered for
+        self.scene: object = None
+
+    def set_scene(self, scene: object):
+        """Drop every target if they were registered for another scene."""
+        if scene is self.scene:
+            return
+        self.scene = scene
+        self.grid.clear()
+        self.targets.clear()
+        self.hovered = None
+
+    def register_rect(self, owner: object, rect: pygame.Rect, on_click: Callable):
+        """Register or refresh a rectangular target for this frame."""
+        self.register(owner, pygame.Rect(rect), None, on_click)
+
+    def register_circle(
+        self,
+        owner: object,
+        center: tuple[float, float],
+        radius: float,
+        on_click: Callable,
+    ):
+        """Register or refresh a circular target for this frame."""
+        x, y = center
+        rect = pygame.Rect(x - radius, y - radius, radius * 2 + 1, radius * 2 + 1)
+        self.register(owner, rect, (x, y, radius), on_click)
+
+    def register(
+        self,
+        owner: object,
+        rect: pygame.Rect,
+        circle: tuple[float, float, float],
+        on_click: Callable,
+    ):
+        """Register a target, only touching the grid when its shape moved."""
+        target = self.targets.get(owner)
+        if target is None:
+            target = self.targets[owner] = HitTarget(owner, on_click, rect, circle)
+            self.add_to_grid(target)
+        elif target.rect != rect or target.circle != circle:
+            self.remove_from_grid(target)
+            target.rect = rect
+            target.circle = circle
+            self.add_to_grid(target)
+
+        target.on_click = on_click
+        target.seen = self.frame
+        target.order = self.draw_order
+        self.draw_order += 1
+
+    def add_to_grid(self, target: HitTarget):
+        """Insert the target into every cell its bounding rect covers."""
+        size = self.cell_size
+        target.cells = [
+            (cx, cy)
+            for cx in range(
+                target.rect.left // size, (target.rect.right - 1) // size + 1
+            )
+            for cy in range(
+                target.rect.top // size, (target.rect.bottom - 1) // size + 1
+            )
+        ]
+        for cell in target.cells:
+            self.grid.setdefault(cell, []).append(target)
+
+    def remove_from_grid(self, target: HitTarget):
+        """Remove the target from the grid."""
+        for cell in target.cells:
+            targets = self.grid[cell]
+            targets.remove(target)
+            if not targets:
+                del self.grid[cell]
+        target.cells = []
+
+    def target_at(self, x: float, y: float) -> HitTarget:
+        """Return the topmost target containing the point, if any."""
+        cell = (int(x) // self.cell_size, int(y) // self.cell_size)
+        hit = None
+        for target in self.grid.get(cell, ()):
+            if target.contains(x, y) and (hit is None or target.order > hit.order):
+                hit = target
+        return hit
+
+    def handle_event(self, event: pygame.event.Event):
+        """Record mouse movement and presses for the next update."""
+        if event.type == pygame.MOUSEMOTION:
+            self.mouse_pos = event.pos
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            self.mouse_pos = event.pos
+            self.presses.append(event.pos)
+
+    def update(self):
+        """Drop stale targets, update hover and dispatch this frame's clicks."""
+        stale = [t for t in self.targets.values() if t.seen != self.frame]
+        for target in stale:
+            self.remove_from_grid(target)
+            del self.targets[target.owner]
+
+        self.frame += 1
+        self.draw_order = 0
+        self.hovered = self.target_at(*self.mouse_pos)
+
+        presses, self.presses = self.presses, []
+        for x, y in presses:
+            target = self.target_at(x, y)
+            if target is not None:
+                target.on_click()
+
+    def is_hovered(self, owner: object) -> bool:
+        """Return whether the owner is the topmost target under the mouse."""
+        return self.hovered is not None and self.hovered.owner is owner
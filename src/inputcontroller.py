@@ -1,107 +1,123 @@
-# Scrapped idea for an input controller to be iterated on
-# or used as basis of what to avoid
+"""Buffered keyboard input mapped to actions."""
 
-"""
+import os
+from collections import deque
 
 import pygame
-from collections import deque
-from gamestate import GameState
+
+from utils import load_jsonc
 
 
 class InputController:
-    \"""Singleton class to handle keyboard input events.\"""
-
-    _instance = None
-
-    def __new__(cls):
-        \"""Ensure only one instance of the class exists.\"""
-        if cls._instance is None:
-            cls._instance = super(InputController, cls).__new__(cls)
-        return cls._instance
-
-    def __init__(self):
-        \"""Initialize input controller.\"""
-        if not hasattr(self, 'initialized'):  # Ensures __init__ runs only once
-            self.game_state = GameState()
-            self.key_states = {}
-            self.key_times = {}
-            self.input_buffer = deque()
-            self.buffer_time = 0.0
-            self.current_time = pygame.time.get_ticks() / 1000.0
-            self.double_press_threshold = 0.3  # seconds
-            self.long_press_threshold = 0.5  # seconds
-            self.input_delay = 0.05  # seconds
-            self.actions = ''
-            self.pressed = False
-            self.held = False
-            self.initialized = True
-
-    def key_down(self, key: str):
-        \"""Handle key down event.\"""
-        if key not in self.key_states or self.key_states[key] == 'released':
-            self.key_states[key] = 'pressed'
-            self.key_times[key] = self.current_time
-            self.input_buffer.append((key, 'pressed', self.current_time))
-        elif self.key_states[key] == 'pressed':
-            if (self.current_time - self.key_times[key]
-               <= self.double_press_threshold):
-                self.key_states[key] = 'double_pressed'
-
-    def key_up(self, key: str):
-        \"""Handle key up event.\"""
-        if key in self.key_states and self.key_states[key] == 'pressed':
-            duration = self.current_time - self.key_times[key]
-            if duration >= self.long_press_threshold:
-                self.key_states[key] = 'long_released'
+    """
+    Keyboard input controller.
+
+    Key events are queued in a buffer as they arrive and applied once per
+    frame by update. Keys are mapped to actions through integer keycode
+    tables built from the bindings config, and every query is a constant
+    time lookup, so presses and releases within a single frame are never
+    lost. If more than buffer_size events arrive in one frame, whole
+    presses are dropped along with their release, so no key can stick.
+    """
+
+    def __init__(self, bindings_path: str = None, buffer_size: int = 64):
+        """Initialize the controller and load the key bindings."""
+        if bindings_path is None:
+            bindings_path = os.path.join(".", "data", "bindings.jsonc")
+
+        self.buffer: deque[tuple[int, bool]] = deque()
+        self.buffer_size = buffer_size
+        self.frame = 0
+        self.load_bindings(bindings_path)
+
+    def load_bindings(self, bindings_path: str):
+        """Build the keycode to action tables from a bindings file."""
+        self.bindings: dict[str, list[str]] = load_jsonc(bindings_path)
+
+        self.action_ids: dict[str, int] = {}
+        self.key_actions: dict[int, tuple[int, ...]] = {}
+        for action_id, (action, key_names) in enumerate(self.bindings.items()):
+            self.action_ids[action] = action_id
+            for key_name in key_names:
+                keycode = pygame.key.key_code(key_name)
+                self.key_actions[keycode] = self.key_actions.get(keycode, ()) + (
+                    action_id,
+                )
+
+        actions = len(self.action_ids)
+        self.keys_held: set[int] = set()
+        self.held_count = [0] * actions
+        self.pressed_frame = [-1] * actions
+        self.released_frame = [-1] * actions
+
+    def handle_event(self, event: pygame.event.Event):
+        """Queue a key event to be applied on the next update."""
+        if event.type == pygame.KEYDOWN:
+            self.queue(event.key, True)
+        elif event.type == pygame.KEYUP:
+            self.queue(event.key, False)
+
+    def queue(self, keycode: int, is_down: bool):
+        """Queue a key change, making room by dropping whole presses."""
+        if len(self.buffer) >= self.buffer_size and not self.drop_press():
+            # Without a whole press to drop, a new press is dropped instead,
+            # but a release is always kept
+            if is_down:
+                return
+        self.buffer.append((keycode, is_down))
+
+    def drop_press(self) -> bool:
+        """Drop the oldest queued press that has its release queued too."""
+        buffer = self.buffer
+        for i, (keycode, is_down) in enumerate(buffer):
+            if not is_down:
+                continue
+            for j in range(i + 1, len(buffer)):
+                if buffer[j] == (keycode, False):
+                    del buffer[j]
+                    del buffer[i]
+                    return True
+        return False
+
+    def update(self):
+        """Apply the queued key events for a new frame."""
+        self.frame += 1
+
+        while self.buffer:
+            keycode, is_down = self.buffer.popleft()
+
+            if is_down:
+                if keycode in self.keys_held:
+                    continue
+                self.keys_held.add(keycode)
+                for action_id in self.key_actions.get(keycode, ()):
+                    self.held_count[action_id] += 1
+                    self.pressed_frame[action_id] = self.frame
             else:
-                self.key_states[key] = 'short_released'
-            self.input_buffer.append((key, 'released', self.current_time))
-        else:
-            self.key_states[key] = 'released'
-
-    def process(self):
-        \"""Process input events from the buffer.\"""
-        self.increment_time()
-
-        while (self.input_buffer and self.current_time - self.buffer_time
-               >= self.input_delay):
-            key, action, event_time = self.input_buffer.popleft()
-            self.buffer_time = self.current_time
-            self.handle_action(key, action)
-
-    def handle_action(self, key, action):
-        \"""Handle buffered key actions.\"""
-        if action == 'pressed':
-            self.pressed = True
-            self.actions = self.map_key_to_action(key)
-        elif action == 'released':
-            self.pressed = False
-            self.held = False
-            self.actions = ''
-
-    def map_key_to_action(self, key):
-        \"""Map key to corresponding action.\"""
-        match key:
-            case 'left': return 'left'
-            case 'right': return 'right'
-            case 'up': return 'up'
-            case 'down': return 'down'
-            case 'escape': return 'escape'
-            case _: return ''
-
-    def increment_time(self):
-        \"""Update the current time based on game state.\"""
-        self.current_time += pygame.time.get_ticks() / 1000.0
-
-    def get_press(self, press_type):
-        \"""Get the current action based on press type.\"""
-        if self.pressed:
-            if press_type == 's' and not self.held:
-                self.held = True
-                return self.actions
-            if press_type == 'h':
-                self.held = True
-                return self.actions
-        return ''
-
-"""
+                if keycode not in self.keys_held:
+                    continue
+                self.keys_held.remove(keycode)
+                for action_id in self.key_actions.get(keycode, ()):
+                    self.held_count[action_id] -= 1
+                    self.released_frame[action_id] = self.frame
+
+    def pressed(self, action: str) -> bool:
+        """Return whether the action was pressed this frame."""
+        return self.pressed_frame[self.action_ids[action]] == self.frame
+
+    def held(self, action: str) -> bool:
+        """Return whether any key bound to the action is down."""
+        return self.held_count[self.action_ids[action]] > 0
+
+    def released(self, action: str) -> bool:
+        """Return whether the action was released this frame."""
+        return self.released_frame[self.action_ids[action]] == self.frame
+
+    @staticmethod
+    def key_label(key_name: str) -> str:
+        """Return a display label for a key name."""
+        if key_name in ("up", "down", "left", "right"):
+            return f"{key_name.title()} Arrow"
+        if len(key_name) == 1:
+            return key_name.upper()
+        return key_name.title()
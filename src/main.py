@@ -1,50 +1,245 @@
 """Driver for Theseus."""
 
+import argparse
+import asyncio
 import os
+import random
 
 import pygame
 
+import aio
+from assets import Asset, AssetManager
+from display import Display
 from gamestate import GameState
+from hittest import HitTester
+from inputcontroller import InputController
+from profiler import Profiler
+from recording import InputRecorder
+from renderer import Renderer
+from scenes.loading_scene import finish_loading, switch_scene
 # from scenes.battle_scene import BattleScene
 from scenes.pause_screen import PauseHandler
 # from scenes.mg_wheel import MGWheel
 from scenes.mg_simon import MGSIMON
+from timestep import FixedTimestep
+
+FRAME_RATE = 30
+# Longest wait for input while idle, in milliseconds
+IDLE_TIMEOUT = 1000
+ICON = Asset("image", os.path.join(".", "assets", "logo.png"))
+
+
+def process_events(events: list[pygame.event.Event]) -> bool:
+    """Handle a frame's events and return False once the game should quit."""
+    game_state = GameState()
+
+    for event in events:
+        if event.type == pygame.QUIT:
+            return False
+        game_state.input.handle_event(event)
+        game_state.hit_tester.handle_event(event)
+
+    game_state.input.update()
+    # The scene may have changed since its targets were registered
+    game_state.hit_tester.set_scene(game_state.scene)
+    game_state.hit_tester.update()
+    return True
+
+
+def run_frame(pause_handler: PauseHandler, frame_time: float, render: bool = True):
+    """
+    Simulate frame_time seconds, then draw and present the active scene.
+
+    Without render the frame is still drawn, since scenes register their
+    click targets while drawing, but the display is not updated.
+    """
+    game_state = GameState()
+
+    AssetManager.poll()
+    with Profiler.section("update"):
+        game_state.timestep.advance(frame_time, game_state.scene.update)
+    game_state.hit_tester.set_scene(game_state.scene)
+
+    Renderer.begin(game_state.scene)
+    with Profiler.section("scene"):
+        game_state.scene.run()
+    with Profiler.section("pause"):
+        pause_handler.run()
+    Profiler.draw_overlay()
+    with Profiler.section("present"):
+        Renderer.present(render)
+
+
+def is_idle(events: list[pygame.event.Event]) -> bool:
+    """Return whether nothing on screen can change until input arrives."""
+    game_state = GameState()
+    return not (
+        events
+        or game_state.scene.is_animating()
+        or Renderer.scene is not game_state.scene
+        or AssetManager.pending
+        or Profiler.enabled
+    )
+
+
+def step(
+    pause_handler: PauseHandler, recorder: InputRecorder = None, wait: bool = True
+) -> bool:
+    """
+    Run one frame of the main loop and return False once the game should quit.
+
+    While idle, a frame without input is skipped without drawing or
+    presenting anything. With wait, an idle frame first blocks for up to
+    IDLE_TIMEOUT until input arrives.
+    """
+    game_state = GameState()
+    # Nothing was simulated while idle, so the wait is not simulated either
+    frame_time = 0 if game_state.idle else game_state.clock.get_time()
+
+    Profiler.begin_frame()
+    with Profiler.section("events"):
+        events = pygame.event.get()
+        if game_state.idle and not events:
+            if wait:
+                event = pygame.event.wait(IDLE_TIMEOUT)
+                # Restart the clock so the next frame time leaves out the wait
+                game_state.clock.tick()
+                if event.type != pygame.NOEVENT:
+                    events = [event, *pygame.event.get()]
+            if not events:
+                return True
+        events = [Display.map_event(event) for event in events]
+        if recorder is not None:
+            recorder.record_frame(frame_time, events)
+
+    return play_frame(pause_handler, events, frame_time)
+
+
+def play_frame(
+    pause_handler: PauseHandler,
+    events: list[pygame.event.Event],
+    frame_time_ms: int,
+    render: bool = True,
+) -> bool:
+    """
+    Handle a frame's events, then simulate and draw it.
+
+    Events are in logical coordinates, as recorded. Shared by the main
+    loop and replays. Returns False once the game should quit.
+    """
+    game_state = GameState()
+
+    with Profiler.section("input"):
+        if not process_events(events):
+            return False
+
+    if game_state.input.pressed("profile"):
+        Profiler.toggle()
+    if game_state.input.pressed("profile_dump") and Profiler.history:
+        print("Profile written to", *Profiler.dump())
+
+    run_frame(pause_handler, frame_time_ms / 1000, render)
+    game_state.idle = is_idle(events)
+    return True
+
+
+async def run_async(pause_handler: PauseHandler, recorder: InputRecorder = None):
+    """
+    Run the main loop as a coroutine.
+
+    Instead of blocking in clock.tick, each frame sleeps until the next
+    frame deadline so background tasks and executor I/O make progress in
+    between frames.
+    """
+    game_state = GameState()
+    loop = asyncio.get_running_loop()
+    frame_duration = 1 / FRAME_RATE
+    deadline = loop.time()
+
+    # Blocking on input would stall background tasks, so idle frames are
+    # only skipped
+    while step(pause_handler, recorder, wait=False):
+        aio.check_failures()
+
+        with Profiler.section("tick"):
+            deadline += frame_duration
+            # Start over from now rather than rushing frames to catch up
+            deadline = max(deadline, loop.time())
+            await asyncio.sleep(deadline - loop.time())
+            game_state.clock.tick()
+        Profiler.end_frame()
+
+    await aio.wait_all()
 
 
 def main():
     """Driver."""
+    parser = argparse.ArgumentParser(description="THESEUS")
+    parser.add_argument("--record", metavar="PATH", help="record input to PATH")
+    parser.add_argument(
+        "--asyncio", action="store_true", help="run the asyncio main loop"
+    )
+    parser.add_argument(
+        "--window",
+        metavar="WxH",
+        type=lambda size: tuple(map(int, size.split("x"))),
+        help="window size, independent of the 1280x720 layout",
+    )
+    parser.add_argument(
+        "--nearest", action="store_true", help="scale without smoothing"
+    )
+    parser.add_argument(
+        "--render-scale",
+        type=float,
+        default=1,
+        help="draw at a fraction of the layout resolution, such as 0.5 or 0.75",
+    )
+    parser.add_argument("--seed", type=int, help="seed the session's randomness")
+    args = parser.parse_args()
+    if not 0 < args.render_scale <= 1:
+        parser.error("--render-scale must be above 0 and at most 1")
+    seed = random.randrange(1 << 32) if args.seed is None else args.seed
+
     pygame.init()
     pygame.font.init()
 
     game_state = GameState()
-    game_state.screen = pygame.display.set_mode((1280, 720))
+    game_state.screen = Display.setup(
+        args.window, smooth=not args.nearest, render_scale=args.render_scale
+    )
     game_state.clock = pygame.time.Clock()
+    game_state.timestep = FixedTimestep()
+    game_state.input = InputController()
+    game_state.hit_tester = HitTester()
+    game_state.rng = random.Random(seed)
     pygame.display.set_caption("THESEUS")
 
-    icon_path = os.path.join(".", "assets", "logo.png")
-    icon_image = pygame.image.load(icon_path).convert_alpha()
-    pygame.display.set_icon(icon_image)
+    AssetManager.acquire(
+        (ICON,), lambda: pygame.display.set_icon(AssetManager.get(ICON))
+    )
 
-    game_state.scene = MGSIMON()
+    switch_scene(MGSIMON)
     pause_handler = PauseHandler()
 
-    is_running = True
-    while is_running:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                is_running = False
-                pygame.quit()
-                quit()
-            if event.type == pygame.KEYDOWN:
-                game_state.key_press = pygame.key.name(event.key)
-            if event.type == pygame.KEYUP:
-                print(pygame.key.name(event.key))
-                game_state.key_press = None
+    recorder = None
+    if args.record:
+        # Start recording in the loaded scene, which replays start from
+        finish_loading()
+        recorder = InputRecorder(args.record, type(game_state.scene).__name__, seed)
 
-        game_state.scene.run()
-        pause_handler.run()
-        pygame.display.update()
-        game_state.clock.tick(30)
+    if args.asyncio:
+        asyncio.run(run_async(pause_handler, recorder))
+    else:
+        while step(pause_handler, recorder):
+            with Profiler.section("tick"):
+                game_state.clock.tick(FRAME_RATE)
+            Profiler.end_frame()
+
+    if recorder is not None:
+        recorder.close()
+    AssetManager.shutdown()
+    pygame.quit()
+    quit()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,136 @@
+"""Module contains the Monster class."""
+
+from collections.abc import Iterator
+
+from effect import Effect
+from parts import Part
+
+
+class Monster:
+    """
+    A tree of parts connected through their sockets.
+
+    A child part plugs one of its male sockets into a female socket of its
+    parent. Socket capacity is checked in constant time and the monster's
+    total stats are updated as parts are attached, detached or affected,
+    so reading them never walks the tree.
+    """
+
+    def __init__(self, root: Part):
+        """Instantiate Monster with a root part."""
+        if root.male_sockets:
+            raise ValueError("The root part is already attached to another part.")
+
+        self.root = root
+        self.parents: dict[Part, Part] = {root: None}
+        self.health = 0
+        self.health_max = 0
+        self.defense = 0
+        self.attack = 0
+        self.add_stats(root, 1)
+
+    @classmethod
+    def from_root(cls, root: Part) -> "Monster":
+        """Return a monster of a root part and the parts already plugged below it."""
+        monster = cls(root)
+        for part in monster.descendants(root):
+            monster.parents[part] = part.male_sockets[0]
+            monster.add_stats(part, 1)
+        return monster
+
+    def __contains__(self, part: Part) -> bool:
+        """Return whether the part belongs to the monster."""
+        return part in self.parents
+
+    def __len__(self) -> int:
+        """Return the number of parts."""
+        return len(self.parents)
+
+    def __iter__(self) -> Iterator[Part]:
+        """Iterate over every part."""
+        return iter(self.parents)
+
+    def __repr__(self):
+        """Return repr for class."""
+        return f"""Monster(
+    parts={len(self)},
+    health={self.health},
+    health_max={self.health_max},
+    defense={self.defense},
+    attack={self.attack}
+)"""
+
+    def add_stats(self, part: Part, sign: int):
+        """Add or, with a sign of -1, remove the stats of a part."""
+        self.health += sign * part.health
+        self.health_max += sign * part.health_max
+        self.defense += sign * part.defense
+        self.attack += sign * part.attack
+
+    def can_attach(self, parent: Part, child: Part) -> bool:
+        """Return whether child can be plugged into parent."""
+        return (
+            parent in self.parents
+            and child not in self.parents
+            and not child.male_sockets
+            and len(parent.female_sockets) < parent.female_sockets_max
+            and child.male_sockets_max > 0
+        )
+
+    def attach(self, parent: Part, child: Part):
+        """
+        Plug child, along with any parts attached below it, into parent.
+
+        Only the attached parts are visited to add their stats.
+        """
+        if not self.can_attach(parent, child):
+            raise ValueError("Part cannot be attached to the parent part.")
+
+        attached = [child, *self.descendants(child)]
+        if any(part in self.parents for part in attached):
+            raise ValueError("Part is already attached to the monster.")
+
+        parent.plug(child)
+        for part in attached:
+            self.parents[part] = part.male_sockets[0]
+            self.add_stats(part, 1)
+
+    def detach(self, part: Part) -> list[Part]:
+        """
+        Unplug a part and every part attached below it.
+
+        The detached parts stay connected to each other so they can be
+        attached again as a whole. Only they are visited to remove their
+        stats. Return the detached parts, starting with part.
+        """
+        if part is self.root:
+            raise ValueError("The root part cannot be detached.")
+        parent = self.parents.get(part)
+        if parent is None:
+            raise ValueError("Part does not belong to the monster.")
+
+        parent.unplug(part)
+
+        detached = [part, *self.descendants(part)]
+        for detached_part in detached:
+            del self.parents[detached_part]
+            self.add_stats(detached_part, -1)
+
+        return detached
+
+    def descendants(self, part: Part) -> Iterator[Part]:
+        """Iterate over every part attached below a part."""
+        stack = list(part.female_sockets)
+        while stack:
+            child = stack.pop()
+            yield child
+            stack.extend(child.female_sockets)
+
+    def apply_effect(self, part: Part, effect: Effect):
+        """Apply an effect to one of the monster's parts."""
+        if part not in self.parents:
+            raise ValueError("Part does not belong to the monster.")
+
+        self.add_stats(part, -1)
+        part.apply_effect(effect)
+        self.add_stats(part, 1)
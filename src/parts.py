@@ -4,17 +4,21 @@ import os
 import random
 from collections.abc import Iterable
 
-from effect import Effect, ProportionalEffect, StaticEffect
-from utils import load_jsonc
+from effect import AffineEffect, Effect, ProportionalEffect, StaticEffect
+from utils import load_jsonc_cached
 
 
 class Title:
     """Stores a list of effects cooresponding to a title."""
 
     titles_data: dict = None
+    # Title name -> Title, and tuple of title names -> compiled effect chain
+    titles: dict = {}
+    chains: dict = {}
 
     def __init__(self, title_name: str):
         """Instantiate Title."""
+        self.name = title_name
         self.effects: list[Effect] = []
 
         title_data = Title.get_template_data(title_name)
@@ -41,11 +45,44 @@ class Title:
             else:
                 raise RuntimeError(f'Invalid scaling metric "{scaling}"')
 
+    @classmethod
+    def get(cls, title_name: str) -> "Title":
+        """Return the shared Title for a name."""
+        title = cls.titles.get(title_name)
+        if title is None:
+            title = cls.titles[title_name] = Title(title_name)
+        return title
+
+    @classmethod
+    def compile_chain(cls, titles: Iterable["Title"]) -> AffineEffect:
+        """Return the effects of every title folded into one cached effect."""
+        titles = tuple(titles)
+        key = tuple(title.name for title in titles)
+        chain = cls.chains.get(key)
+        if chain is None:
+            chain = cls.chains[key] = AffineEffect.compile(
+                effect for title in titles for effect in title.effects
+            )
+        return chain
+
+    @classmethod
+    def get_template_names(cls) -> list[str]:
+        """Return the names of every title template."""
+        cls.load_templates_data()
+        return list(cls.titles_data)
+
+    @classmethod
+    def load_templates_data(cls):
+        """Load the title templates data if it is not loaded yet."""
+        if cls.titles_data is None:
+            cls.titles_data = load_jsonc_cached(
+                os.path.join(".", "data", "titles.jsonc")
+            )
+
     @classmethod
     def get_template_data(cls, title_name: str):
         """Return the template data for a title given the name."""
-        if cls.titles_data is None:
-            cls.titles_data = load_jsonc(os.path.join(".", "data", "titles.jsonc"))
+        cls.load_templates_data()
 
         title_data = cls.titles_data.get(title_name)
         if title_data is None:
@@ -74,11 +111,14 @@ class Part:
         slots_max: int,
         modifier: float,
         titles: tuple[Title],
+        template_name: str = None,
     ):
         """Instantiate Part."""
         if isinstance(titles, Iterable) is False:
             raise ValueError('Argument "titles" must be an iterable.')
 
+        self.template_name = template_name
+        self.titles = tuple(titles)
         self.health = health
         self.health_max = health
         self.defense = defense
@@ -90,14 +130,10 @@ class Part:
         self.slots = []
         self.slots_max = slots_max
 
-        # Rarity / Minigame Effect
-        self.apply_effect(ProportionalEffect(modifier, modifier, modifier))
-
-        # Title effects
-
-        for title in titles:
-            for effect in title.effects:
-                self.apply_effect(effect)
+        # Rarity / Minigame Effect followed by every title effect
+        self.apply_effect(
+            AffineEffect(modifier, modifier, modifier).then(Title.compile_chain(titles))
+        )
 
     def __repr__(self):
         """Return repr for class."""
@@ -113,6 +149,16 @@ class Part:
     slots_used={len(self.slots)}
 )"""
 
+    def plug(self, child: "Part"):
+        """Plug child into one of the female sockets."""
+        self.female_sockets.append(child)
+        child.male_sockets.append(self)
+
+    def unplug(self, child: "Part"):
+        """Unplug child from the female sockets."""
+        self.female_sockets.remove(child)
+        child.male_sockets.remove(self)
+
     def apply_effect(self, effect: Effect):
         """Apply an effect to a part."""
         self.health, self.defense, self.attack = effect.apply(
@@ -142,7 +188,8 @@ class Part:
             male_sockets_max=male_sockets_max,
             slots_max=slots_max,
             modifier=random.uniform(0.5, 2),
-            titles=titles,
+            titles=tuple(Title.get(name) for name in titles),
+            template_name=part_name,
         )
 
     @classmethod
@@ -175,14 +222,63 @@ class Part:
             male_sockets_max=male_sockets_max,
             slots_max=slots_max,
             modifier=modifier,
-            titles=titles,
+            titles=tuple(Title.get(name) for name in titles),
+            template_name=part_name,
         )
 
+    @classmethod
+    def factory_saved(
+        cls,
+        part_name: str,
+        health: float,
+        health_max: float,
+        defense: float,
+        attack: float,
+        female_sockets_max: int,
+        male_sockets_max: int,
+        slots_max: int,
+        titles: tuple[str] = tuple(),
+    ):
+        """
+        Construct a Part.
+
+        This is intended to be used for restoring saved parts, whose stats
+        already include their modifier and title effects.
+        """
+        part = Part(
+            health=health_max,
+            defense=defense,
+            attack=attack,
+            female_sockets_max=female_sockets_max,
+            male_sockets_max=male_sockets_max,
+            slots_max=slots_max,
+            modifier=1,
+            titles=(),
+            template_name=part_name,
+        )
+        part.health = health
+        part.health_max = health_max
+        part.defense = defense
+        part.attack = attack
+        part.titles = tuple(Title.get(name) for name in titles)
+        return part
+
+    @classmethod
+    def get_template_names(cls) -> list[str]:
+        """Return the names of every part template."""
+        cls.load_templates_data()
+        return list(cls.parts_data)
+
+    @classmethod
+    def load_templates_data(cls):
+        """Load the part templates data if it is not loaded yet."""
+        if cls.parts_data is None:
+            cls.parts_data = load_jsonc_cached(os.path.join(".", "data", "parts.jsonc"))
+
     @classmethod
     def get_template_data(cls, part_name: str):
         """Return the template data for a part given the name."""
-        if cls.parts_data is None:
-            cls.parts_data = load_jsonc(os.path.join(".", "data", "parts.jsonc"))
+        cls.load_templates_data()
 
         part_data = cls.parts_data.get(part_name)
         if part_data is None:
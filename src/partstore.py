@@ -0,0 +1,255 @@
+"""Module contains the PartStore class for storing parts in bulk."""
+
+import random
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+
+from effect import AffineEffect, Effect
+from parts import Part, Title
+
+
+class PartView:
+    """Lightweight view of a single part in a PartStore with the Part API."""
+
+    __slots__ = ("store", "index")
+
+    def __init__(self, store: "PartStore", index: int):
+        """Instantiate PartView."""
+        self.store = store
+        self.index = index
+
+    def __repr__(self):
+        """Return repr for class."""
+        return Part.__repr__(self)
+
+    # Views are created on every access, so they compare by the part they
+    # view. That lets monsters, sockets and saves key parts by their views
+
+    def __eq__(self, other) -> bool:
+        """Return whether other is a view of the same part."""
+        if not isinstance(other, PartView):
+            return NotImplemented
+        return self.store is other.store and self.index == other.index
+
+    def __hash__(self) -> int:
+        """Return the hash of the viewed part."""
+        return hash((id(self.store), self.index))
+
+    def apply_effect(self, effect: Effect):
+        """Apply an effect to the part."""
+        self.health, self.defense, self.attack = effect.apply(
+            self.health, self.defense, self.attack
+        )
+
+    @property
+    def template_name(self) -> str:
+        """Return the name of the part template."""
+        return self.store.template_names[self.store.template_id[self.index]]
+
+    @property
+    def titles(self) -> tuple[Title, ...]:
+        """Return the titles."""
+        return self.store.title_sets[self.store.title_set[self.index]]
+
+    @property
+    def health(self) -> float:
+        """Return the health."""
+        return self.store.health[self.index]
+
+    @health.setter
+    def health(self, value: float):
+        self.store.health[self.index] = value
+
+    @property
+    def health_max(self) -> float:
+        """Return the maximum health."""
+        return self.store.health_max[self.index]
+
+    @health_max.setter
+    def health_max(self, value: float):
+        self.store.health_max[self.index] = value
+
+    @property
+    def defense(self) -> float:
+        """Return the defense."""
+        return self.store.defense[self.index]
+
+    @defense.setter
+    def defense(self, value: float):
+        self.store.defense[self.index] = value
+
+    @property
+    def attack(self) -> float:
+        """Return the attack."""
+        return self.store.attack[self.index]
+
+    @attack.setter
+    def attack(self, value: float):
+        self.store.attack[self.index] = value
+
+    @property
+    def female_sockets_max(self) -> int:
+        """Return the number of female sockets."""
+        return self.store.female_sockets_max[self.index]
+
+    @property
+    def male_sockets_max(self) -> int:
+        """Return the number of male sockets."""
+        return self.store.male_sockets_max[self.index]
+
+    @property
+    def slots_max(self) -> int:
+        """Return the number of slots."""
+        return self.store.slots_max[self.index]
+
+    # Reads never create the sparse lists, so they return an empty tuple
+    # for parts without any. Sockets are changed through plug and unplug
+
+    @property
+    def female_sockets(self) -> Sequence:
+        """Return the parts in the female sockets."""
+        return self.store.female_sockets.get(self.index, ())
+
+    @property
+    def male_sockets(self) -> Sequence:
+        """Return the parts in the male sockets."""
+        return self.store.male_sockets.get(self.index, ())
+
+    @property
+    def slots(self) -> Sequence:
+        """Return the items in the slots."""
+        return self.store.slots.get(self.index, ())
+
+    def plug(self, child: "PartView"):
+        """Plug child into one of the female sockets."""
+        self.store.female_sockets.setdefault(self.index, []).append(child)
+        self.store.male_sockets.setdefault(child.index, []).append(self)
+
+    def unplug(self, child: "PartView"):
+        """Unplug child from the female sockets."""
+        for sockets, index, part in (
+            (self.store.female_sockets, self.index, child),
+            (self.store.male_sockets, child.index, self),
+        ):
+            parts = sockets[index]
+            parts.remove(part)
+            if not parts:
+                del sockets[index]
+
+
+class PartStore:
+    """
+    Struct of arrays storage for parts.
+
+    Each stat is a typed array column indexed by part, so large numbers of
+    parts cost a few bytes each. Socket and slot lists are only created for
+    parts that use them. Individual parts are accessed through PartView.
+    """
+
+    def __init__(self):
+        """Instantiate an empty PartStore."""
+        self.template_names: list[str] = []
+        self.template_ids: dict[str, int] = {}
+
+        self.template_id = array("I")
+        # Parts share interned tuples of titles, indexed by title_set
+        self.title_sets: list[tuple[Title, ...]] = [()]
+        self.title_set_ids: dict[tuple[Title, ...], int] = {(): 0}
+        self.title_set = array("I")
+        self.health = array("d")
+        self.health_max = array("d")
+        self.defense = array("d")
+        self.attack = array("d")
+        self.female_sockets_max = array("H")
+        self.male_sockets_max = array("H")
+        self.slots_max = array("H")
+
+        self.female_sockets: dict[int, list] = {}
+        self.male_sockets: dict[int, list] = {}
+        self.slots: dict[int, list] = {}
+
+    def __len__(self) -> int:
+        """Return the number of parts."""
+        return len(self.template_id)
+
+    def __getitem__(self, index: int) -> PartView:
+        """Return a view of the part at index."""
+        if not -len(self) <= index < len(self):
+            raise IndexError("PartStore index out of range")
+        return PartView(self, index % len(self))
+
+    def __iter__(self) -> Iterator[PartView]:
+        """Iterate over views of every part."""
+        return (PartView(self, index) for index in range(len(self)))
+
+    def get_template_id(self, part_name: str) -> int:
+        """Return the id of a part template, adding it if it is new."""
+        template_id = self.template_ids.get(part_name)
+        if template_id is None:
+            template_id = self.template_ids[part_name] = len(self.template_names)
+            self.template_names.append(part_name)
+        return template_id
+
+    def get_title_set_id(self, titles: tuple[Title, ...]) -> int:
+        """Return the id of a tuple of titles, adding it if it is new."""
+        title_set_id = self.title_set_ids.get(titles)
+        if title_set_id is None:
+            title_set_id = self.title_set_ids[titles] = len(self.title_sets)
+            self.title_sets.append(titles)
+        return title_set_id
+
+    def factory_natural_batch(
+        self,
+        part_name: str,
+        n: int,
+        titles: Iterable[str] = tuple(),
+        rng: random.Random = None,
+    ) -> range:
+        """
+        Construct n naturally generated parts and return their indices.
+
+        Equivalent to calling Part.factory_natural n times. Modifiers are
+        drawn from rng when given, otherwise from the random module.
+        """
+        part_data = Part.get_template_data(part_name)
+
+        cost = part_data.get("cost")
+        sockets = part_data.get("sockets")
+        base = cost // 3
+
+        # Modifiers are uniform(0.5, 2), i.e. 0.5 + 1.5 * random(), so the base
+        # stat, the modifier and the title chain fold into one affine map
+        # applied to the raw random values
+        low = 0.5 * base
+        spread = AffineEffect(3 * low, 3 * low, 3 * low, low, low, low)
+        titles = tuple(Title.get(name) for name in titles)
+        chain = spread.then(Title.compile_chain(titles))
+        roll = (rng or random).random
+        rolls = array("d", [roll() for _ in range(n)])
+        health, defense, attack = chain.apply_batch(rolls, rolls, rolls)
+
+        start = len(self)
+        self.template_id.extend(array("I", [self.get_template_id(part_name)]) * n)
+        self.title_set.extend(array("I", [self.get_title_set_id(titles)]) * n)
+        self.health.extend(health)
+        self.health_max.extend(array("d", [base]) * n)
+        self.defense.extend(defense)
+        self.attack.extend(attack)
+        self.female_sockets_max.extend(array("H", [sockets.get("female")]) * n)
+        self.male_sockets_max.extend(array("H", [sockets.get("male")]) * n)
+        self.slots_max.extend(array("H", [part_data.get("slots")]) * n)
+
+        return range(start, len(self))
+
+    def apply_effect_batch(self, effect: AffineEffect, indices: range = None):
+        """Apply an effect to every part, or to a contiguous range of parts."""
+        if indices is None:
+            indices = range(len(self))
+        section = slice(indices.start, indices.stop)
+
+        health, defense, attack = effect.apply_batch(
+            self.health[section], self.defense[section], self.attack[section]
+        )
+        self.health[section] = health
+        self.defense[section] = defense
+        self.attack[section] = attack
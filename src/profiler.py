@@ -0,0 +1,199 @@
+"""Lightweight frame profiler with an on-screen graph and trace export."""
+
+import csv
+import functools
+import json
+import time
+from collections import deque
+from collections.abc import Callable
+from contextlib import nullcontext
+
+import pygame
+
+from fonts import FontRegistry
+from gamestate import GameState
+from renderer import Renderer
+
+# Colors of the top level stages in the overlay graph
+STAGE_COLORS = {
+    "events": (80, 160, 255),
+    "input": (160, 120, 255),
+    "update": (80, 220, 120),
+    "scene": (255, 200, 60),
+    "pause": (255, 120, 200),
+    "present": (255, 90, 60),
+    "tick": (120, 120, 120),
+}
+
+
+class Section:
+    """Context manager that records the duration of one profiled section."""
+
+    __slots__ = ("name", "start")
+
+    def __init__(self, name: str):
+        """Instantiate Section."""
+        self.name = name
+
+    def __enter__(self):
+        """Start timing."""
+        Profiler.depth += 1
+        self.start = time.perf_counter_ns()
+
+    def __exit__(self, *exc_info):
+        """Stop timing and record the section in the current frame."""
+        end = time.perf_counter_ns()
+        Profiler.depth -= 1
+        if Profiler.current is not None:
+            Profiler.current.append(
+                (self.name, Profiler.depth, self.start, end - self.start)
+            )
+
+
+class Profiler:
+    """
+    Per frame profiler, disabled by default.
+
+    Sections are timed with the section context manager or the profiled
+    decorator and kept for the last history frames in a ring buffer. When
+    disabled, both cost a single attribute check.
+    """
+
+    enabled: bool = False
+    history: deque = deque(maxlen=240)
+    current: list = None
+    frame_start: int = 0
+    depth: int = 0
+
+    overlay_rect = pygame.Rect(16, 16, 240, 96)
+    # Frame time in milliseconds at the top of the graph
+    overlay_scale: float = 50
+
+    disabled = nullcontext()
+
+    @classmethod
+    def toggle(cls):
+        """Enable or disable profiling, dropping any recorded frames."""
+        cls.enabled = not cls.enabled
+        cls.history.clear()
+        cls.current = None
+        cls.depth = 0
+
+    @classmethod
+    def section(cls, name: str):
+        """Return a context manager timing a section while enabled."""
+        if not cls.enabled:
+            return cls.disabled
+        return Section(name)
+
+    @classmethod
+    def begin_frame(cls):
+        """Start recording a frame."""
+        if cls.enabled:
+            cls.frame_start = time.perf_counter_ns()
+            cls.current = []
+
+    @classmethod
+    def end_frame(cls):
+        """Add the recorded frame to the ring buffer."""
+        if cls.current is not None:
+            cls.history.append((cls.frame_start, cls.current))
+            cls.current = None
+
+    @classmethod
+    def draw_overlay(cls):
+        """Draw a rolling graph of the time spent in each top level stage."""
+        if not cls.enabled or not cls.history:
+            return
+
+        screen = GameState().screen
+        rect = cls.overlay_rect
+        graph = pygame.Surface(rect.size)
+        graph.fill((20, 20, 20))
+
+        scale = rect.height / cls.overlay_scale
+        x = rect.width - len(cls.history)
+        for _, records in cls.history:
+            y = rect.height
+            for name, depth, _, duration in records:
+                color = STAGE_COLORS.get(name)
+                if depth or color is None:
+                    continue
+                height = duration / 1e6 * scale
+                pygame.draw.line(graph, color, (x, y), (x, y - height))
+                y -= height
+            x += 1
+
+        # Mark the frame budget at 30 fps
+        budget = rect.height - 1000 / 30 * scale
+        pygame.draw.line(graph, (200, 200, 200), (0, budget), (rect.width, budget))
+
+        _, records = cls.history[-1]
+        total = sum(record[3] for record in records if not record[1]) / 1e6
+        font = FontRegistry.get(font_size=14)
+        graph.blit(font.render(f"{total:.2f} ms", True, (255, 255, 255)), (4, 4))
+
+        Renderer.drawn(
+            cls,
+            screen.blit(graph, rect),
+            len(cls.history),
+            functools.partial(screen.blit, graph, rect),
+        )
+
+    @classmethod
+    def export_csv(cls, filepath: str):
+        """Write every recorded section as a row of a CSV file."""
+        origin = cls.history[0][0] if cls.history else 0
+        with open(filepath, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(("frame", "name", "depth", "start_ms", "duration_ms"))
+            for index, (_, records) in enumerate(cls.history):
+                for name, depth, start, duration in records:
+                    writer.writerow(
+                        (index, name, depth, (start - origin) / 1e6, duration / 1e6)
+                    )
+
+    @classmethod
+    def export_chrome_trace(cls, filepath: str):
+        """Write the recorded sections in the Chrome trace event format."""
+        origin = cls.history[0][0] if cls.history else 0
+        events = [
+            {
+                "name": name,
+                "ph": "X",
+                "ts": (start - origin) / 1000,
+                "dur": duration / 1000,
+                "pid": 0,
+                "tid": 0,
+            }
+            for _, records in cls.history
+            for name, _, start, duration in records
+        ]
+        with open(filepath, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+    @classmethod
+    def dump(cls, prefix: str = "profile") -> tuple[str, str]:
+        """Export the ring buffer as CSV and Chrome trace files."""
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        csv_path = f"{prefix}-{stamp}.csv"
+        trace_path = f"{prefix}-{stamp}.json"
+        cls.export_csv(csv_path)
+        cls.export_chrome_trace(trace_path)
+        return csv_path, trace_path
+
+
+def profiled(name: str) -> Callable:
+    """Time every call of the decorated function as a section."""
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not Profiler.enabled:
+                return func(*args, **kwargs)
+            with Section(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,109 @@
+"""
+Compact binary input recordings.
+
+A recording starts with a header holding the seed of the session's
+randomness and the name of the starting scene, followed by one record
+per frame: the frame time in milliseconds and the input events handled
+that frame.
+"""
+
+import struct
+from collections.abc import Iterator
+
+import pygame
+
+MAGIC = b"THSR"
+VERSION = 2
+
+# Magic, version, seed and the length of the scene name
+HEADER = struct.Struct("<4sHIB")
+FRAME = struct.Struct("<HH")
+EVENT = struct.Struct("<Bihh")
+
+# Recorded event types, in the order of their ids in the file
+EVENT_TYPES = (
+    pygame.QUIT,
+    pygame.KEYDOWN,
+    pygame.KEYUP,
+    pygame.MOUSEMOTION,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP,
+)
+EVENT_IDS = {event_type: event_id for event_id, event_type in enumerate(EVENT_TYPES)}
+
+
+def pack_event(event: pygame.event.Event) -> bytes:
+    """Return the packed record of an event."""
+    event_id = EVENT_IDS[event.type]
+    if event.type in (pygame.KEYDOWN, pygame.KEYUP):
+        return EVENT.pack(event_id, event.key, 0, 0)
+    if event.type == pygame.MOUSEMOTION:
+        return EVENT.pack(event_id, 0, *event.pos)
+    if event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+        return EVENT.pack(event_id, event.button, *event.pos)
+    return EVENT.pack(event_id, 0, 0, 0)
+
+
+def unpack_event(data: bytes, offset: int) -> pygame.event.Event:
+    """Return the event packed at an offset."""
+    event_id, value, x, y = EVENT.unpack_from(data, offset)
+    event_type = EVENT_TYPES[event_id]
+    if event_type in (pygame.KEYDOWN, pygame.KEYUP):
+        return pygame.event.Event(event_type, key=value, mod=0)
+    if event_type == pygame.MOUSEMOTION:
+        return pygame.event.Event(event_type, pos=(x, y), rel=(0, 0), buttons=(0, 0, 0))
+    if event_type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+        return pygame.event.Event(event_type, pos=(x, y), button=value)
+    return pygame.event.Event(event_type)
+
+
+class InputRecorder:
+    """Writes the events and frame times of each frame to a recording."""
+
+    def __init__(self, filepath: str, scene_name: str, seed: int):
+        """Open the recording and write its header."""
+        name = scene_name.encode()
+        self.file = open(filepath, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, seed, len(name)) + name)
+
+    def record_frame(self, frame_time_ms: int, events: list[pygame.event.Event]):
+        """Write the frame time and the recordable events of a frame."""
+        records = [pack_event(event) for event in events if event.type in EVENT_IDS]
+        self.file.write(FRAME.pack(min(frame_time_ms, 0xFFFF), len(records)))
+        self.file.write(b"".join(records))
+
+    def close(self):
+        """Flush and close the recording."""
+        self.file.close()
+
+
+class InputRecording:
+    """Reads a recording back one frame at a time."""
+
+    def __init__(self, filepath: str):
+        """Read a recording into memory and check its header."""
+        with open(filepath, "rb") as f:
+            self.data = f.read()
+
+        magic, version, self.seed, name_length = HEADER.unpack_from(self.data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f'"{filepath}" is not a version {VERSION} recording.')
+
+        name_start = HEADER.size
+        name_end = self.frames_offset = name_start + name_length
+        self.scene_name = self.data[name_start:name_end].decode()
+
+    def frames(self) -> Iterator[tuple[int, list[pygame.event.Event]]]:
+        """Iterate over the frame time and events of every frame."""
+        data = self.data
+        offset = self.frames_offset
+        while offset < len(data):
+            frame_time_ms, event_count = FRAME.unpack_from(data, offset)
+            offset += FRAME.size
+
+            events = []
+            for _ in range(event_count):
+                events.append(unpack_event(data, offset))
+                offset += EVENT.size
+
+            yield frame_time_ms, events
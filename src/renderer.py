@@ -0,0 +1,176 @@
+"""Dirty rectangle renderer."""
+
+from collections.abc import Callable
+from typing import Any
+
+import pygame
+
+from display import Display
+from gamestate import GameState
+from scenes.scene import Scene
+
+
+def merge_rects(rects: list[pygame.Rect]) -> list[pygame.Rect]:
+    """Return the rects with every overlapping group merged into one rect."""
+    merged: list[pygame.Rect] = []
+    for rect in rects:
+        rect = pygame.Rect(rect)
+        i = rect.collidelist(merged)
+        while i != -1:
+            rect.union_ip(merged.pop(i))
+            i = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
+
+
+# State of objects whose drawing was damaged, equal to no state they draw with
+DAMAGED = object()
+
+
+class Renderer:
+    """
+    Track what changed on screen and update only those areas.
+
+    Each scene draws its static content once into a background surface.
+    Objects then call is_current to skip drawing when nothing about them
+    changed, erase to restore the background under their old rect and
+    drawn to record where they drew and how to repeat the drawing. When an
+    erase damages objects already drawn this frame, they are redrawn over
+    the restored area right away. Objects that stop drawing are erased when
+    the frame is presented.
+    """
+
+    scene: Scene = None
+    background: pygame.Surface = None
+    full_redraw: bool = True
+    dirty: list[pygame.Rect] = []
+    # object -> (rect on screen, state it was drawn with, redraw)
+    visible: dict = {}
+    # Objects drawn or kept this frame, in drawing order
+    touched: dict = {}
+    pixels_updated: int = 0
+
+    @classmethod
+    def begin(cls, scene: Scene):
+        """Prepare a frame, rebuilding the background if the scene changed."""
+        if scene is not cls.scene:
+            cls.set_scene(scene)
+
+    @classmethod
+    def set_scene(cls, scene: Scene):
+        """Draw the scene background and invalidate everything on screen."""
+        screen = GameState().screen
+        cls.scene = scene
+        cls.background = pygame.Surface(screen.get_size()).convert()
+        scene.draw_background(cls.background)
+        screen.blit(cls.background, (0, 0))
+        cls.visible.clear()
+        cls.touched.clear()
+        cls.dirty.clear()
+        cls.full_redraw = True
+
+    @classmethod
+    def invalidate(cls):
+        """Redraw the whole scene on the next frame."""
+        cls.scene = None
+
+    @classmethod
+    def is_current(cls, obj, state) -> bool:
+        """Return whether obj is on screen exactly as it would draw now."""
+        entry = cls.visible.get(obj)
+        if entry is not None and entry[1] == state:
+            cls.touched[obj] = None
+            return True
+        return False
+
+    @classmethod
+    def forget(cls, obj):
+        """Force obj to redraw without erasing what is under it."""
+        cls.visible.pop(obj, None)
+
+    @classmethod
+    def erase(cls, obj):
+        """Restore the background under the last drawing of obj."""
+        entry = cls.visible.pop(obj, None)
+        if entry is not None:
+            cls.restore(entry[0])
+
+    @classmethod
+    def restore(cls, rect: pygame.Rect):
+        """
+        Restore the background under rect and repair anything it covered.
+
+        Objects already drawn this frame are redrawn within rect, in drawing
+        order, so they never vanish for a frame. Other covered objects are
+        marked damaged, so they redraw, erasing their whole old rect, or are
+        erased when the frame is presented.
+        """
+        screen = GameState().screen
+        screen.blit(cls.background, rect, rect)
+        cls.dirty.append(rect)
+
+        redrawn = set()
+        for obj, (obj_rect, state, redraw) in cls.visible.items():
+            if not obj_rect.colliderect(rect):
+                continue
+            if obj in cls.touched and redraw is not None:
+                redrawn.add(obj)
+            else:
+                cls.visible[obj] = (obj_rect, DAMAGED, None)
+
+        if redrawn:
+            clip = screen.get_clip()
+            screen.set_clip(rect)
+            for obj in cls.touched:
+                if obj in redrawn:
+                    cls.visible[obj][2]()
+            screen.set_clip(clip)
+
+    @classmethod
+    def drawn(
+        cls,
+        obj,
+        rect: pygame.Rect,
+        state=None,
+        redraw: Callable[[], Any] = None,
+    ):
+        """
+        Record that obj drew to rect with the given state.
+
+        redraw repeats the drawing, so it can be repaired within the frame.
+        """
+        cls.visible[obj] = (rect, state, redraw)
+        cls.touched[obj] = None
+        cls.dirty.append(rect)
+
+    @classmethod
+    def present(cls, show: bool = True):
+        """
+        Erase objects that were not drawn and update the changed areas.
+
+        Without show the frame is finished without updating the display.
+        """
+        stale = [obj for obj in cls.visible if obj not in cls.touched]
+        for obj in stale:
+            cls.erase(obj)
+        cls.touched.clear()
+
+        if not show:
+            cls.full_redraw = False
+            cls.dirty.clear()
+            cls.pixels_updated = 0
+            return
+
+        if cls.full_redraw:
+            cls.full_redraw = False
+            cls.dirty.clear()
+            Display.present()
+            width, height = GameState().screen.get_size()
+            cls.pixels_updated = width * height
+            return
+
+        rects = merge_rects(cls.dirty)
+        cls.dirty.clear()
+        if rects:
+            Display.present(rects)
+        cls.pixels_updated = sum(rect.w * rect.h for rect in rects)
@@ -0,0 +1,110 @@
+"""
+Replay an input recording headlessly.
+
+Feeds the recorded events and frame times back through the same frame
+path as main.main, as fast as possible, and prints frame time statistics
+as JSON. Record a session with python src/main.py --record PATH.
+
+Usage: python src/replay.py PATH [--realtime] [--no-render]
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+# Keep stdout to the JSON report
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame  # noqa: E402
+
+from assets import AssetManager  # noqa: E402
+from display import Display  # noqa: E402
+from gamestate import GameState  # noqa: E402
+from hittest import HitTester  # noqa: E402
+from inputcontroller import InputController  # noqa: E402
+from main import FRAME_RATE, play_frame  # noqa: E402
+from recording import InputRecording  # noqa: E402
+from scenes.battle_scene import BattleScene  # noqa: E402
+from scenes.loading_scene import finish_loading, switch_scene  # noqa: E402
+from scenes.mg_simon import MGSIMON  # noqa: E402
+from scenes.mg_wheel import MGWheel  # noqa: E402
+from scenes.pause_screen import PauseHandler  # noqa: E402
+from timestep import FixedTimestep  # noqa: E402
+
+SCENES = {
+    "BattleScene": BattleScene,
+    "MGWheel": MGWheel,
+    "MGSIMON": MGSIMON,
+}
+
+
+def main():
+    """Replay a recording and print frame time statistics."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("path")
+    parser.add_argument(
+        "--realtime", action="store_true", help="pace frames like the game does"
+    )
+    parser.add_argument(
+        "--no-render",
+        dest="render",
+        action="store_false",
+        help="draw frames without updating the display",
+    )
+    args = parser.parse_args()
+
+    recording = InputRecording(args.path)
+    if recording.scene_name not in SCENES:
+        parser.error(f'Recording starts in unknown scene "{recording.scene_name}"')
+
+    pygame.init()
+    pygame.font.init()
+
+    game_state = GameState()
+    game_state.screen = Display.setup()
+    game_state.clock = pygame.time.Clock()
+    game_state.timestep = FixedTimestep()
+    game_state.input = InputController()
+    game_state.hit_tester = HitTester()
+    game_state.rng = random.Random(recording.seed)
+    switch_scene(SCENES[recording.scene_name])
+    finish_loading()
+    pause_handler = PauseHandler()
+
+    durations = []
+    start = time.perf_counter()
+    for frame_time_ms, events in recording.frames():
+        frame_start = time.perf_counter()
+        if not play_frame(pause_handler, events, frame_time_ms, args.render):
+            break
+        durations.append((time.perf_counter() - frame_start) * 1000)
+
+        if args.realtime:
+            game_state.clock.tick(FRAME_RATE)
+    elapsed = time.perf_counter() - start
+
+    report = {"frames": len(durations), "elapsed_s": elapsed}
+    if len(durations) >= 2:
+        quantiles = statistics.quantiles(durations, n=100, method="inclusive")
+        report.update(
+            {
+                "p50_ms": quantiles[49],
+                "p95_ms": quantiles[94],
+                "p99_ms": quantiles[98],
+                "max_ms": max(durations),
+                "final_scene": type(game_state.scene).__name__,
+            }
+        )
+    print(json.dumps(report, indent=2))
+
+    AssetManager.shutdown()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+Monte Carlo sampler for part stat distributions.
+
+Samples naturally generated parts for every part template combined with
+every combination of titles, fanned out over a process pool, and prints
+merged histograms and quantiles as JSON.
+
+Usage: python src/sampler.py [--samples N] [--max-titles N] [--workers N]
+       [--seed N] [--bin-width W]
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+
+from parts import Part, Title
+from partstore import PartStore
+
+STATS = ("health", "defense", "attack")
+
+
+class StreamingHistogram:
+    """Fixed width histogram that can be filled in batches and merged."""
+
+    def __init__(self, bin_width: float):
+        """Instantiate an empty histogram."""
+        self.bin_width = bin_width
+        self.bins: dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add_many(self, values: Sequence[float]):
+        """Add a batch of values."""
+        if not values:
+            return
+
+        bins = self.bins
+        bin_width = self.bin_width
+        for value in values:
+            index = math.floor(value / bin_width)
+            bins[index] = bins.get(index, 0) + 1
+        self.count += len(values)
+        self.total += math.fsum(values)
+        self.min = min(self.min, min(values))
+        self.max = max(self.max, max(values))
+
+    def merge(self, other: "StreamingHistogram"):
+        """Add the contents of another histogram with the same bin width."""
+        if other.bin_width != self.bin_width:
+            raise ValueError("Cannot merge histograms with different bin widths.")
+
+        for index, count in other.bins.items():
+            self.bins[index] = self.bins.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q: float) -> float:
+        """Return an estimate of the q-th quantile, interpolated within a bin."""
+        target = q * self.count
+        seen = 0
+        for index in sorted(self.bins):
+            count = self.bins[index]
+            if seen + count >= target:
+                value = (index + (target - seen) / count) * self.bin_width
+                return min(max(value, self.min), self.max)
+            seen += count
+        return self.max
+
+    def summary(self) -> dict:
+        """Return the count, mean, extremes and a few quantiles."""
+        if not self.count:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "mean": self.total / self.count,
+            "min": self.min,
+            "p5": self.quantile(0.05),
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "max": self.max,
+        }
+
+
+def sample(
+    part_name: str, titles: tuple[str, ...], samples: int, seed: int, bin_width: float
+) -> tuple[str, tuple[str, ...], dict[str, StreamingHistogram]]:
+    """
+    Sample one part template and title combination.
+
+    The random stream is seeded from the seed, the part and the titles, so
+    every task gets its own reproducible stream regardless of which worker
+    runs it or in which order.
+    """
+    rng = random.Random(f"{seed}:{part_name}:{','.join(titles)}")
+
+    store = PartStore()
+    store.factory_natural_batch(part_name, samples, titles, rng)
+
+    histograms = {}
+    for stat in STATS:
+        histograms[stat] = StreamingHistogram(bin_width)
+        histograms[stat].add_many(getattr(store, stat))
+
+    return part_name, titles, histograms
+
+
+def main():
+    """Sample every part and title combination and print a report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--samples", type=int, default=10000)
+    parser.add_argument("--max-titles", type=int, default=2)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--bin-width", type=float, default=0.5)
+    args = parser.parse_args()
+
+    part_names = Part.get_template_names()
+    title_names = Title.get_template_names()
+    tasks = [
+        (part_name, titles)
+        for part_name in part_names
+        for count in range(args.max_titles + 1)
+        for titles in combinations(title_names, count)
+    ]
+    if not tasks:
+        parser.error("There are no part templates to sample.")
+
+    report = {}
+    overall = {stat: StreamingHistogram(args.bin_width) for stat in STATS}
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        results = executor.map(
+            sample,
+            *zip(*tasks),
+            [args.samples] * len(tasks),
+            [args.seed] * len(tasks),
+            [args.bin_width] * len(tasks),
+            chunksize=max(len(tasks) // (4 * (args.workers or 1)), 1),
+        )
+        for part_name, titles, histograms in results:
+            report.setdefault(part_name, {})[",".join(titles)] = {
+                stat: histogram.summary() for stat, histogram in histograms.items()
+            }
+            for stat, histogram in histograms.items():
+                overall[stat].merge(histogram)
+
+    print(
+        json.dumps(
+            {
+                "tasks": len(tasks),
+                "samples_per_task": args.samples,
+                "overall": {
+                    stat: histogram.summary() for stat, histogram in overall.items()
+                },
+                "parts": report,
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
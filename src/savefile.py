@@ -0,0 +1,346 @@
+"""
+Compact binary save files for parts and monsters.
+
+A save starts with an uncompressed header, followed by a zlib stream of a
+string table, one fixed width record per part and one record per monster.
+Each part record is followed by its title and slot names as string table
+indices and the parts in its female sockets as part indices. Monsters are
+stored as the index of their root part.
+"""
+
+import gc
+import struct
+import zlib
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from operator import attrgetter
+
+from monster import Monster
+from parts import Part
+from utils import write_atomic
+
+MAGIC = b"THSV"
+VERSION = 1
+
+# Magic, version and the number of strings, parts and monsters
+HEADER = struct.Struct("<4sHIII")
+STRING = struct.Struct("<H")
+# Template name, health, health_max, defense, attack, socket and slot maxes,
+# then the number of titles, female socket links and slots that follow
+PART = struct.Struct("<IddddHHHHHH")
+MONSTER = struct.Struct("<I")
+# String index of a part without a template
+NO_STRING = 0xFFFFFFFF
+
+
+@dataclass(slots=True)
+class PartRecord:
+    """Saved fields of a part."""
+
+    template_name: str
+    health: float
+    health_max: float
+    defense: float
+    attack: float
+    female_sockets_max: int
+    male_sockets_max: int
+    slots_max: int
+    titles: tuple[str, ...]
+    female_sockets: tuple[int, ...]
+    slots: tuple[str, ...]
+
+
+# Plain fields of a part, in the order of the part record
+PART_FIELDS = attrgetter(
+    "template_name",
+    "health",
+    "health_max",
+    "defense",
+    "attack",
+    "female_sockets_max",
+    "male_sockets_max",
+    "slots_max",
+    "titles",
+)
+
+
+@dataclass
+class SaveSnapshot:
+    """
+    Copy of the saved state, safe to serialize off the main thread.
+
+    Only the parts' fields and the contents of their socket and slot lists
+    are copied. Socket links stay as parts, and are turned into indices
+    when the snapshot is serialized.
+    """
+
+    parts: list[Part]
+    fields: list[tuple]
+    female_sockets: list[tuple[Part, ...]]
+    slots: list[tuple[str, ...]]
+    roots: list[Part]
+
+
+def snapshot(parts: Iterable[Part], monsters: Iterable[Monster] = ()) -> SaveSnapshot:
+    """Copy the state of parts and monsters without serializing it."""
+    # Built from C level iteration only. The garbage collector is paused
+    # since the many new tuples would otherwise trigger full collections
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        parts = list(parts)
+        return SaveSnapshot(
+            parts,
+            list(map(PART_FIELDS, parts)),
+            list(map(tuple, map(attrgetter("female_sockets"), parts))),
+            list(map(tuple, map(attrgetter("slots"), parts))),
+            list(map(attrgetter("root"), monsters)),
+        )
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def serialize(save: SaveSnapshot, level: int = 6) -> bytes:
+    """Return the contents of a save file."""
+    strings: dict[str, int] = {}
+
+    def intern(name: str) -> int:
+        if name is None:
+            return NO_STRING
+        index = strings.get(name)
+        if index is None:
+            index = strings[name] = len(strings)
+        return index
+
+    indices = {part: index for index, part in enumerate(save.parts)}
+    body = bytearray()
+    pack = PART.pack
+    try:
+        for fields, children, slots in zip(
+            save.fields, save.female_sockets, save.slots
+        ):
+            template_name, *stats, titles = fields
+            body += pack(
+                intern(template_name),
+                *stats,
+                len(titles),
+                len(children),
+                len(slots),
+            )
+            links = (
+                *(intern(title.name) for title in titles),
+                *(indices[child] for child in children),
+                *map(intern, slots),
+            )
+            if links:
+                body += struct.pack(f"<{len(links)}I", *links)
+        for root in save.roots:
+            body += MONSTER.pack(indices[root])
+    except KeyError:
+        raise ValueError("Every attached part must be saved as well.") from None
+
+    table = bytearray()
+    for name in strings:
+        encoded = name.encode()
+        table += STRING.pack(len(encoded)) + encoded
+
+    compressor = zlib.compressobj(level)
+    return b"".join(
+        (
+            HEADER.pack(MAGIC, VERSION, len(strings), len(save.parts), len(save.roots)),
+            compressor.compress(table),
+            compressor.compress(body),
+            compressor.flush(),
+        )
+    )
+
+
+def write_save(filepath: str, save: SaveSnapshot):
+    """Serialize, compress and atomically write a save file."""
+    write_atomic(filepath, serialize(save))
+
+
+class SaveReader:
+    """
+    Streams the records of a save file.
+
+    The file is decompressed a chunk at a time as records are read, so a
+    large save is never held in memory whole. Records must be read in
+    order: parts first, then monster roots.
+    """
+
+    def __init__(self, filepath: str, chunk_size: int = 1 << 16):
+        """Open a save file and read its header and string table."""
+        self.file = open(filepath, "rb")
+        self.chunk_size = chunk_size
+        self.decompressor = zlib.decompressobj()
+        self.buffer = b""
+        self.offset = 0
+
+        header = self.file.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise ValueError(f'"{filepath}" is not a save file.')
+        magic, version, string_count, self.part_count, self.monster_count = (
+            HEADER.unpack(header)
+        )
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f'"{filepath}" is not a version {VERSION} save file.')
+
+        self.strings = []
+        for _ in range(string_count):
+            (length,) = self.unpack(STRING)
+            self.strings.append(self.read(length).decode())
+
+    def __enter__(self) -> "SaveReader":
+        """Return the reader."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Close the file."""
+        self.close()
+
+    def close(self):
+        """Close the file."""
+        self.file.close()
+
+    def fill(self, size: int):
+        """Decompress chunks until at least size bytes are buffered."""
+        offset = self.offset
+        available = len(self.buffer) - offset
+        if available >= size:
+            return
+
+        pending = [self.buffer[offset:]]
+        while available < size:
+            chunk = self.file.read(self.chunk_size)
+            if chunk:
+                data = self.decompressor.decompress(chunk)
+            else:
+                data = self.decompressor.flush()
+                if not data:
+                    raise ValueError("Save file is truncated.")
+            pending.append(data)
+            available += len(data)
+
+        self.buffer = b"".join(pending)
+        self.offset = 0
+
+    def read(self, size: int) -> bytes:
+        """Return the next size bytes."""
+        self.fill(size)
+        start = self.offset
+        self.offset = end = start + size
+        return self.buffer[start:end]
+
+    def unpack(self, record: struct.Struct) -> tuple:
+        """Return the fields of the next record."""
+        self.fill(record.size)
+        fields = record.unpack_from(self.buffer, self.offset)
+        self.offset += record.size
+        return fields
+
+    def unpack_indices(self, count: int) -> tuple[int, ...]:
+        """Return the next count indices."""
+        return struct.unpack(f"<{count}I", self.read(4 * count)) if count else ()
+
+    def parts(self) -> Iterator[PartRecord]:
+        """Iterate over the part records."""
+        strings = self.strings
+        for _ in range(self.part_count):
+            *fields, title_count, link_count, slot_count = self.unpack(PART)
+            template = fields[0]
+            fields[0] = None if template == NO_STRING else strings[template]
+            titles = self.unpack_indices(title_count)
+            links = self.unpack_indices(link_count)
+            slots = self.unpack_indices(slot_count)
+            yield PartRecord(
+                *fields,
+                tuple(strings[index] for index in titles),
+                links,
+                tuple(strings[index] for index in slots),
+            )
+
+    def monster_roots(self) -> Iterator[int]:
+        """Iterate over the root part index of each monster."""
+        for _ in range(self.monster_count):
+            yield self.unpack(MONSTER)[0]
+
+
+def load_save(filepath: str) -> tuple[list[Part], list[Monster]]:
+    """Return the parts and monsters of a save file."""
+    parts = []
+    links = []
+    with SaveReader(filepath) as reader:
+        for record in reader.parts():
+            part = Part.factory_saved(
+                record.template_name,
+                record.health,
+                record.health_max,
+                record.defense,
+                record.attack,
+                record.female_sockets_max,
+                record.male_sockets_max,
+                record.slots_max,
+                record.titles,
+            )
+            part.slots.extend(record.slots)
+            parts.append(part)
+            links.append(record.female_sockets)
+
+        for part, children in zip(parts, links):
+            for index in children:
+                child = parts[index]
+                part.female_sockets.append(child)
+                child.male_sockets.append(part)
+
+        monsters = [Monster.from_root(parts[root]) for root in reader.monster_roots()]
+
+    return parts, monsters
+
+
+class Autosaver:
+    """
+    Saves in the background at a fixed interval.
+
+    The state is snapshotted on the main thread, which only copies
+    references and lists, then serialized, compressed and written by a worker thread. A
+    save is skipped while the previous one is still being written.
+    """
+
+    def __init__(self, filepath: str, interval: float = 60):
+        """Instantiate Autosaver."""
+        self.filepath = filepath
+        self.interval = interval
+        self.elapsed = 0.0
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="save")
+        self.future: Future = None
+
+    def save(self, parts: Iterable[Part], monsters: Iterable[Monster] = ()) -> bool:
+        """Start saving in the background and return whether a save started."""
+        if self.future is not None:
+            if not self.future.done():
+                return False
+            # Reraise the error of the previous save
+            self.future.result()
+
+        self.elapsed = 0.0
+        self.future = self.executor.submit(
+            write_save, self.filepath, snapshot(parts, monsters)
+        )
+        return True
+
+    def update(
+        self, dt: float, parts: Iterable[Part], monsters: Iterable[Monster] = ()
+    ):
+        """Advance the timer by dt seconds and save once the interval passes."""
+        self.elapsed += dt
+        if self.elapsed >= self.interval:
+            self.save(parts, monsters)
+
+    def close(self):
+        """Wait for any save in progress and stop the worker thread."""
+        self.executor.shutdown(wait=True)
+        if self.future is not None:
+            self.future.result()
@@ -2,24 +2,34 @@
 
 import pygame
 
+from assets import Asset
+from battle import Battle, Combatant
 from button import Button
 from gamestate import GameState
 from scenes.scene import Scene
-from text import TextWrapper
+from text import Label
 
 
 class BattleScene(Scene):
     """Battle Scene."""
 
-    def __init__(self):
+    assets = (Asset("font", "freesansbold.ttf", 20),)
+
+    def __init__(self, player: Combatant = None, enemy: Combatant = None):
         """Initialize Battle scene."""
+        if player is None:
+            player = Combatant("Theseus", 100, 100, 10, 15)
+        if enemy is None:
+            enemy = Combatant("Minotaur", 120, 120, 8, 14)
+        self.battle = Battle(player, enemy, GameState().rng)
+
         self.attack_button = Button(
             "1) Attack",
             40,
             510,
             150,
             30,
-            TextWrapper("Attacking!", (500, 300, 100, 100)).draw,
+            lambda: self.battle.player_turn("attack"),
         )
         self.defend_button = Button(
             "2) Defend",
@@ -27,7 +37,7 @@ class BattleScene(Scene):
             550,
             150,
             30,
-            TextWrapper("Defending!", (500, 300, 100, 100)).draw,
+            lambda: self.battle.player_turn("defend"),
         )
         self.run_button = Button(
             "3) RUN",
@@ -35,21 +45,51 @@ class BattleScene(Scene):
             590,
             150,
             30,
-            TextWrapper("Running!", (500, 300, 100, 100)).draw,
+            lambda: self.battle.player_turn("run"),
+        )
+        self.player_label = Label(
+            "",
+            (60, 400, 400, 30),
+            source=lambda: self.battle.player.health,
+            formatter=lambda health: self.health_text(self.battle.player),
+        )
+        self.enemy_label = Label(
+            "",
+            (820, 60, 400, 30),
+            source=lambda: self.battle.enemy.health,
+            formatter=lambda health: self.health_text(self.battle.enemy),
+        )
+        self.message_label = Label(
+            "",
+            (240, 515, 980, 30),
+            source=lambda: len(self.battle.log),
+            formatter=lambda length: self.battle.log[-1] if length else "",
         )
 
-    def run(self):
-        """Draw the battle scene."""
-        game_state = GameState()
-
-        game_state.screen.fill((100, 0, 255))
+    def draw_background(self, surface: pygame.Surface):
+        """Draw the battle windows."""
+        surface.fill((100, 0, 255))
 
         battle_window = pygame.Rect(30, 30, 1220, 450)
-        pygame.draw.rect(game_state.screen, (200, 200, 200), battle_window)
+        pygame.draw.rect(surface, (200, 200, 200), battle_window)
 
         options_window = pygame.Rect(30, 500, 1220, 200)
-        pygame.draw.rect(game_state.screen, (200, 200, 200), options_window)
+        pygame.draw.rect(surface, (200, 200, 200), options_window)
+
+    @staticmethod
+    def health_text(combatant: Combatant) -> str:
+        """Return the name and health of a combatant."""
+        return f"{combatant.name}  {combatant.health:.0f}/{combatant.health_max:.0f}"
 
+    def is_animating(self) -> bool:
+        """Return False, since the battle only advances on input."""
+        return False
+
+    def run(self):
+        """Draw the battle scene."""
         self.attack_button.draw()
         self.defend_button.draw()
         self.run_button.draw()
+        self.player_label.draw()
+        self.enemy_label.draw()
+        self.message_label.draw()
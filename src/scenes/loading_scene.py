@@ -0,0 +1,81 @@
+"""LoadingScene class."""
+
+import time
+from functools import partial
+
+import pygame
+
+from assets import Asset, AssetManager
+from gamestate import GameState
+from renderer import Renderer
+from scenes.scene import Scene
+from scenestack import SceneStack
+
+
+class LoadingScene(Scene):
+    """Progress bar shown while the assets of the next scene load."""
+
+    def __init__(self, manifest: tuple[Asset, ...]):
+        """Initialize Loading scene."""
+        self.manifest = manifest
+        screen = GameState().screen
+        self.bar = pygame.Rect(0, 0, screen.get_width() / 3, 12)
+        self.bar.center = screen.get_rect().center
+
+    def run(self):
+        """Draw the loading progress."""
+        progress = AssetManager.progress(self.manifest)
+        if Renderer.is_current(self, progress):
+            return
+        Renderer.erase(self)
+
+        screen = GameState().screen
+        rect = self.draw_bar(screen, progress)
+        Renderer.drawn(self, rect, progress, partial(self.draw_bar, screen, progress))
+
+    def draw_bar(self, screen: pygame.Surface, progress: float) -> pygame.Rect:
+        """Draw the progress bar and return its rect."""
+        # Drawn apart and blitted, which every screen supports
+        bar = pygame.Surface(self.bar.size, pygame.SRCALPHA)
+        pygame.draw.rect(bar, (80, 80, 80), bar.get_rect(), 1)
+        filled = bar.get_rect()
+        filled.width = round(filled.width * progress)
+        pygame.draw.rect(bar, (200, 200, 200), filled)
+        return screen.blit(bar, self.bar)
+
+
+def switch_scene(scene_class: type[Scene], *args, **kwargs):
+    """
+    Switch to a new scene without blocking on its assets.
+
+    The scene is constructed once its manifest is loaded, with a loading
+    scene shown in the meantime. The assets of the previous scene are
+    released afterwards so any shared with the new scene stay loaded.
+    """
+    game_state = GameState()
+    previous = getattr(game_state, "scene", None)
+    manifest = scene_class.assets
+
+    loading = None
+    if not AssetManager.is_ready(manifest):
+        loading = game_state.scene = LoadingScene(manifest)
+
+    def enter():
+        if loading is None:
+            game_state.scene = scene_class(*args, **kwargs)
+        # Replace the loading scene even under an overlay like the pause
+        # menu, but skip if something else switched scenes meanwhile
+        elif game_state.scene is loading or loading in SceneStack.scenes:
+            SceneStack.replace(loading, scene_class(*args, **kwargs))
+
+    AssetManager.acquire(manifest, enter)
+    if previous is not None:
+        AssetManager.release(previous.assets)
+
+
+def finish_loading():
+    """Block until the scene being loaded, if any, becomes active."""
+    game_state = GameState()
+    while isinstance(game_state.scene, LoadingScene):
+        AssetManager.poll()
+        time.sleep(0.001)
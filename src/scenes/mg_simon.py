@@ -1,30 +1,41 @@
 """Mini Game Wheel Scene class."""
 
+from functools import partial
+
 import pygame
 
+from assets import Asset
 from gamestate import GameState
-from text import TextWrapper
+from renderer import Renderer
+from shapes import ShapeCache
+from text import Label
 from scenes.mini_game_scene import MiniGameScene
 
 
 class MGSIMON(MiniGameScene):
     """Simon Says Mini Game Scene."""
 
+    background_color = (100, 0, 255)
+    assets = (Asset("font", "freesansbold.ttf", 40),)
+
     def __init__(self):
         """Initialize Simon Says Mini Game Scene."""
         screen = GameState().screen
         self.center = (screen.get_width() / 2, screen.get_height() / 2)
-        self.text_wrapper = TextWrapper(
+        self.text_wrapper = Label(
                 '0', (self.center[0]-20, self.center[1] / 2),
                 font_size=40, color=pygame.Color(255, 255, 255),
         )
 
         self.arrow = Arrow('right')
 
+    def is_animating(self) -> bool:
+        """Return False, since the arrow only turns on input."""
+        return False
+
     def run(self):
         """Draw the Simon Says Mini Game scene."""
         game_state = GameState()
-        game_state.screen.fill((100, 0, 255))
 
         """
         mouse_x, mouse_y = pygame.mouse.get_pos()
@@ -34,8 +45,9 @@ class MGSIMON(MiniGameScene):
                 font_size=40, color=pygame.Color(255, 255, 255),
         )
         """
-        if (game_state.key_press in self.arrow.directions):
-            self.arrow.change_dir(game_state.key_press)
+        for direction in ("right", "down", "left", "up"):
+            if game_state.input.pressed(direction):
+                self.arrow.change_dir(direction)
 
         self.arrow.draw(self.center)
         self.text_wrapper.draw()
@@ -63,6 +75,11 @@ class Arrow():
                            "s": 90,
                            "a": 180,
                            "w": 270}
+
+        # Rasterize all four orientations up front
+        for direction in ("right", "down", "left", "up"):
+            self.change_dir(direction)
+            ShapeCache.polygon(self.points, self.color1)
         self.change_dir(self.dir)
 
     def draw(self,
@@ -70,9 +87,16 @@ class Arrow():
         """Draw the arrow."""
         game_state = GameState()
 
-        points = [tuple(b + (self.size * a) for a, b in zip(t, pos))
-                  for t in self.grid]
-        pygame.draw.polygon(game_state.screen, self.color1, points)
+        state = (self.dir, tuple(pos), self.size, self.color1)
+        if Renderer.is_current(self, state):
+            return
+        Renderer.erase(self)
+
+        surface, (left, top) = ShapeCache.polygon(self.points, self.color1)
+        dest = (round(pos[0]) + left, round(pos[1]) + top)
+        rect = game_state.screen.blit(surface, dest)
+        Renderer.drawn(self, rect, state,
+                       partial(game_state.screen.blit, surface, dest))
 
     def rotate_grid_clcws(self, rot: int):
         """Rotate the grid."""
@@ -93,3 +117,5 @@ class Arrow():
 
         self.grid = [tuple(a - b for a, b in zip(t, (8, 8))) for t in points]
         self.rotate_grid_clcws(self.directions[self.dir])
+        self.points = tuple((self.size * x, self.size * y)
+                            for x, y in self.grid)
@@ -2,15 +2,22 @@
 
 import pygame
 import math
+from functools import partial
 
+from assets import Asset
 from gamestate import GameState
-from text import TextWrapper
+from renderer import Renderer
+from shapes import ShapeCache
+from text import Label
 from scenes.mini_game_scene import MiniGameScene
 
 
 class MGWheel(MiniGameScene):
     """Wheel Mini Game Scene."""
 
+    background_color = (100, 0, 255)
+    assets = (Asset("font", "freesansbold.ttf", 40),)
+
     def __init__(self):
         """Initialize Wheel Mini Game Scene."""
         screen = GameState().screen
@@ -19,30 +26,34 @@ class MGWheel(MiniGameScene):
         self.ball = Ball(self.wheel.center, 20, 20, self.wheel.radius)
         self.timer = Timer(0)
         self.start = False
-        self.text_wrapper = TextWrapper(
+        self.text_wrapper = Label(
             '0:00', (self.center[0] - 40, 150), font_size=40,
             color=pygame.Color(255, 255, 255),
+            # The display only changes once per hundredth of a second
+            source=lambda: int(self.timer.time // 10),
+            formatter=lambda hundredths: self.timer.display(),
         )
 
-    def run(self):
-        """Update and draw the Wheel Mini Game scene."""
-        game_state = GameState()
-        game_state.screen.fill((100, 0, 255))
+    def draw_background(self, surface: pygame.Surface):
+        """Draw the wheel, which never moves."""
+        super().draw_background(surface)
+        self.wheel.draw(surface)
 
+    def update(self, dt: float):
+        """Advance the ball and timer by a fixed step."""
         if self.ball.clicked:
             self.start = True
 
-        time = game_state.clock.get_time() / 1000.0
         if self.start:
-            self.ball.move(time)
-            self.timer.add_time(time * 1000)
+            self.ball.move(dt)
+            self.timer.add_time(dt * 1000)
 
-        self.text_wrapper = TextWrapper(
-            self.timer.display(), (self.center[0] - 40, 150), font_size=40,
-            color=pygame.Color(255, 255, 255),
-        )
+    def is_animating(self) -> bool:
+        """Return whether the ball and timer are running."""
+        return self.start
 
-        self.wheel.draw()
+    def run(self):
+        """Draw the Wheel Mini Game scene."""
         self.ball.draw()
         self.text_wrapper.draw()
 
@@ -62,11 +73,12 @@ class Wheel():
         self.radius = radius
         self.width = width
 
-    def draw(self):
+    def draw(self, surface: pygame.Surface = None):
         """Draw the wheel."""
-        game_state = GameState()
-        pygame.draw.circle(game_state.screen, self.color, self.center,
-                           self.radius, self.width)
+        if surface is None:
+            surface = GameState().screen
+        ring = ShapeCache.circle(self.radius, self.color, self.width)
+        surface.blit(ring, ring.get_rect(center=self.center))
 
 
 class Ball():
@@ -102,6 +114,8 @@ class Ball():
         self.cur_sec = 0
         self.prev_sec = self.cur_sec
         self.update_pos(self.pos, self.pos)
+        self.prev_pos_x = self.pos_x
+        self.prev_pos_y = self.pos_y
 
     def draw(self):
         """Draw the ball."""
@@ -109,23 +123,35 @@ class Ball():
         self.time += game_state.clock.get_time() / 1000
         self.cur_sec = math.floor(self.time)
 
-        x = self.center[0] + (self.ring - self.radius) * math.cos(self.pos_x)
-        y = self.center[1] + ((self.ring - self.radius) * math.sin(self.pos_y))
+        # Interpolate between the last two physics steps
+        alpha = game_state.timestep.alpha
+        pos_x = self.prev_pos_x + (self.pos_x - self.prev_pos_x) * alpha
+        pos_y = self.prev_pos_y + (self.pos_y - self.prev_pos_y) * alpha
+
+        x = self.center[0] + (self.ring - self.radius) * math.cos(pos_x)
+        y = self.center[1] + ((self.ring - self.radius) * math.sin(pos_y))
 
-        mouse_x, mouse_y = pygame.mouse.get_pos()
-        if self.is_mouse_over(mouse_x, mouse_y, x, y):
-            pygame.draw.circle(game_state.screen, self.color2,
-                               (x, y), self.size)
-            if pygame.mouse.get_pressed()[0]:
-                self.clicked = True
-        else:
-            pygame.draw.circle(game_state.screen, self.color1,
-                               (x, y), self.size)
+        game_state.hit_tester.register_circle(self, (x, y), self.radius, self.click)
+        hovered = game_state.hit_tester.is_hovered(self)
+
+        state = (x, y, hovered)
+        if Renderer.is_current(self, state):
+            return
+        Renderer.erase(self)
+
+        ball = ShapeCache.circle(self.size,
+                                 self.color2 if hovered else self.color1)
+        rect = game_state.screen.blit(
+            ball, ball.get_rect(center=(round(x), round(y))))
+        Renderer.drawn(self, rect, state,
+                       partial(game_state.screen.blit, ball, rect))
 
     def move(self, time: float):
         """Update the ball physics."""
         # self.vel += self.acel * time
         # self.vel = self.max_vel if self.vel > self.max_vel else self.vel
+        self.prev_pos_x = self.pos_x
+        self.prev_pos_y = self.pos_y
         self.vel = min(self.vel + self.acel * time, self.max_vel)
         self.pos += (self.vel * time)
         self.update_pos(self.pos, self.pos)
@@ -135,31 +161,27 @@ class Ball():
         self.pos_x = pos_x
         self.pos_y = pos_y
 
-    def is_mouse_over(self, mouse_x: float, mouse_y: float,
-                      x: float, y: float) -> bool:
-        """Check if the mouse is over the ball."""
-        return (
-            x - self.radius < mouse_x < x + self.radius and
-            y - self.radius < mouse_y < y + self.radius
-        )
+    def click(self):
+        """Handle a click on the ball."""
+        self.clicked = True
 
 
 class Timer():
     """Abstract Stop watch Creation."""
 
-    def __init__(self, time: int):
+    def __init__(self, time: float):
         """Initialize the timer."""
         self.time = time
 
-    def add_time(self, time: int):
+    def add_time(self, time: float):
         """Update the time on the timer."""
-        self.time += int(time)
+        self.time += time
 
     def display(self):
         """Display the time in 00:00 format."""
 
         # splits the time in milliseconds, into seconds and milliseconds
-        sec = self.time // 1000
+        sec = int(self.time // 1000)
         mil = int(self.time % 1000 / 10)
 
         return f'{sec:02d}:{mil:02d}'
@@ -5,8 +5,10 @@ from dataclasses import dataclass
 from typing import Callable
 
 from scenes.scene import Scene
+from scenestack import SceneStack
 from gamestate import GameState
-from text import TextWrapper
+from inputcontroller import InputController
+from text import Label
 from button import Button
 
 
@@ -21,10 +23,12 @@ class PauseHandler:
         """Update the pause state based on user input."""
         game_state = GameState()
 
-        # Toggle pause state when 'escape' key is pressed
-        if not self.is_paused and game_state.key_press == 'escape':
+        # Toggle pause state when a 'pause' key is pressed
+        if not self.is_paused and game_state.input.pressed('pause'):
             self.is_paused = True
-            game_state.scene = PauseScreen(game_state.scene, "Pause", self)
+            pause_screen = SceneStack.cached(
+                "pause", lambda: PauseScreen("Pause", self))
+            SceneStack.push(pause_screen, freeze=True)
 
     def unpause(self):
         """Reset the paused state."""
@@ -42,9 +46,13 @@ class Element:
 class MenuScreen(Scene):
     """Base class for screens in the pause menu."""
 
-    def __init__(self, prev_scene: Scene, title: str):
-        """Initialize the screen with the previous scene."""
-        self.prev_scene = prev_scene
+    background_color = (80, 80, 80)
+    text_color = (255, 255, 255)
+    # Frozen frame of the scene below, set when pushed onto the SceneStack
+    backdrop: pygame.Surface = None
+
+    def __init__(self, title: str):
+        """Initialize the screen with a title."""
         self.create_title(title)
         self.to_draw = [self.title]
 
@@ -52,10 +60,21 @@ class MenuScreen(Scene):
         """Update the screen data."""
         pass
 
+    def is_animating(self) -> bool:
+        """Return False, since menus only change on input."""
+        return False
+
     def draw(self):
         """Draw the screen data."""
         pass
 
+    def draw_background(self, surface: pygame.Surface):
+        """Draw the frozen scene below, or a flat color without one."""
+        if self.backdrop is None:
+            super().draw_background(surface)
+        else:
+            surface.blit(self.backdrop, (0, 0))
+
     def get_func(self, func: str) -> Callable:
         """Get a function in the menu by its name."""
         return lambda *args: None  # Default implementation
@@ -64,8 +83,8 @@ class MenuScreen(Scene):
         """Create a title for the menu screen."""
         game_state = GameState()
         x, y = game_state.screen.get_size()
-        self.title = TextWrapper(title, (x / 2 - 100, 100, 200, 50),
-                                 font_size=40)
+        self.title = Label(title, (x / 2 - 100, 100, 200, 50),
+                           font_size=40, color=self.text_color)
 
     def create_in_order(
             self,
@@ -95,10 +114,11 @@ class MenuScreen(Scene):
                     pygame.Color(120, 120, 120), pygame.Color(150, 150, 150)
                     ))
             elif element.type == "label":
-                objects.append(TextWrapper(
+                objects.append(Label(
                     element.text, (x, y, size[0], size[1]),
                     font_size=(element.action if element.action
-                               is not None else 20)
+                               is not None else 20),
+                    color=self.text_color,
                         ))
         return objects
 
@@ -106,11 +126,9 @@ class MenuScreen(Scene):
 class PauseScreen(MenuScreen):
     """Class to display the pause screen with necessary components."""
 
-    def __init__(self, prev_scene: Scene, title: str,
-                 pause_handler: PauseHandler):
-        """Initialize the PauseScreen with the previous scene and a
-        pause handler."""
-        super().__init__(prev_scene, title)
+    def __init__(self, title: str, pause_handler: PauseHandler):
+        """Initialize the PauseScreen with a pause handler."""
+        super().__init__(title)
         self.pause_handler = pause_handler
         game_state = GameState()
         x, y = game_state.screen.get_size()
@@ -127,21 +145,19 @@ class PauseScreen(MenuScreen):
 
     def draw(self):
         """Draw the pause screen."""
-        game_state = GameState()
-        game_state.screen.fill((80, 80, 80))
         for obj in self.to_draw:
             obj.draw()
 
     def unpause(self):
         """Unpauses the game and return to the original scene."""
         self.pause_handler.unpause()
-        game_state = GameState()
-        game_state.scene = self.prev_scene
+        SceneStack.pop()
 
     def goto_controls(self):
         """Changes scene to the controls screen"""
-        game_state = GameState()
-        game_state.scene = ControlsScreen(self, "Controls")
+        controls_screen = SceneStack.cached(
+            "controls", lambda: ControlsScreen("Controls"))
+        SceneStack.push(controls_screen, freeze=True)
 
     def get_func(self, func: str) -> Callable:
         """Get a function in the pause menu by its name."""
@@ -154,42 +170,26 @@ class PauseScreen(MenuScreen):
 class ControlsScreen(MenuScreen):
     """Class to display the controls menu."""
 
-    def __init__(self, scene: Scene, title: str):
-        """Initialize the ControlsScreen with the previous scene."""
-        super().__init__(scene, title)
+    def __init__(self, title: str):
+        """Initialize the ControlsScreen."""
+        super().__init__(title)
 
         game_state = GameState()
         x, y = game_state.screen.get_size()
 
         # Create labels representing actions
+        actions = ('up', 'left', 'down', 'right')
         self.to_draw += self.create_in_order(
             (x/2 - 215, 215), (200, 50), (0, 75),
-            Element('label', 'Up', 25),
-            Element('label', 'Left', 25),
-            Element('label', 'Down', 25),
-            Element('label', 'Right', 25),
-        )
-        # Create buttons to match each action label
-        self.to_draw += self.create_in_order(
-            (x/2 - 125, 200), (200, 50), (250, 0),
-            Element('button', 'W', 'None'),
-            Element('button', 'Up Arrow', 'None'),
-        )
-        self.to_draw += self.create_in_order(
-            (x/2 - 125, 275), (200, 50), (250, 0),
-            Element('button', 'A', 'None'),
-            Element('button', 'Left Arrow', 'None'),
-        )
-        self.to_draw += self.create_in_order(
-            (x/2 - 125, 350), (200, 50), (250, 0),
-            Element('button', 'S', 'None'),
-            Element('button', 'Down Arrow', 'None'),
-        )
-        self.to_draw += self.create_in_order(
-            (x/2 - 125, 425), (200, 50), (250, 0),
-            Element('button', 'D', 'None'),
-            Element('button', 'Right Arrow', 'None'),
+            *(Element('label', action.title(), 25) for action in actions),
         )
+        # Create buttons showing the keys bound to each action
+        for i, action in enumerate(actions):
+            self.to_draw += self.create_in_order(
+                (x/2 - 125, 200 + i * 75), (200, 50), (250, 0),
+                *(Element('button', InputController.key_label(key), 'None')
+                  for key in game_state.input.bindings[action]),
+            )
         # Create button to return to previous screen
         self.to_draw += self.create_in_order(
             (x/2, 600), (200, 50), (0, 0),
@@ -202,15 +202,12 @@ class ControlsScreen(MenuScreen):
 
     def draw(self):
         """Draw the controls menu."""
-        game_state = GameState()
-        game_state.screen.fill((80, 80, 80))
         for obj in self.to_draw:
             obj.draw()
 
     def return_to_pause_screen(self):
         """Changes scene back to the pause menu"""
-        game_state = GameState()
-        game_state.scene = self.prev_scene
+        SceneStack.pop()
 
     def get_func(self, func: str) -> Callable:
         """Get a function in the controls menu by its name."""
@@ -1,7 +1,25 @@
 """Scene class."""
 
+import pygame
+
+from assets import Asset
+
 
 class Scene:
     """Parent class for Scenes."""
 
-    ...
+    background_color: pygame.Color = (0, 0, 0)
+    # Assets loaded in the background before the scene is constructed
+    assets: tuple[Asset, ...] = ()
+
+    def update(self, dt: float):
+        """Advance the simulation by a fixed step of dt seconds."""
+        pass
+
+    def is_animating(self) -> bool:
+        """Return whether the scene can change without any input."""
+        return True
+
+    def draw_background(self, surface: pygame.Surface):
+        """Draw the static content that sits behind every object."""
+        surface.fill(self.background_color)
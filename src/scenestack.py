@@ -0,0 +1,100 @@
+"""Stack of suspended scenes below the active one."""
+
+from collections.abc import Callable
+
+import pygame
+
+from gamestate import GameState
+from scenes.scene import Scene
+
+
+def snapshot(
+    surface: pygame.Surface, darken: pygame.Color = (96, 96, 96), blur: int = 0
+) -> pygame.Surface:
+    """
+    Return a frozen copy of a surface for use as a backdrop.
+
+    darken multiplies each channel by darken / 255, and a blur above 1
+    smooths the copy by scaling it down by that factor and back up.
+    """
+    frozen = surface.copy()
+    if blur > 1:
+        width, height = frozen.get_size()
+        small = pygame.transform.smoothscale(
+            frozen, (max(width // blur, 1), max(height // blur, 1))
+        )
+        frozen = pygame.transform.smoothscale(small, (width, height))
+    frozen.fill(darken, special_flags=pygame.BLEND_MULT)
+    return frozen.convert()
+
+
+class SceneStack:
+    """
+    Scenes suspended below the active scene, such as a game under a menu.
+
+    Suspended scenes are neither updated nor drawn. Scenes that are opened
+    repeatedly, like menus, can be kept alive in a cache instead of being
+    constructed again every time.
+    """
+
+    scenes: list[Scene] = []
+    cache: dict[str, Scene] = {}
+
+    @classmethod
+    def cached(cls, name: str, factory: Callable[[], Scene]) -> Scene:
+        """Return the scene cached under name, constructing it on first use."""
+        scene = cls.cache.get(name)
+        if scene is None:
+            scene = cls.cache[name] = factory()
+        return scene
+
+    @classmethod
+    def push(
+        cls,
+        scene: Scene,
+        freeze: bool = False,
+        darken: pygame.Color = (96, 96, 96),
+        blur: int = 0,
+    ):
+        """
+        Suspend the active scene and make scene active.
+
+        With freeze, the last frame on screen becomes the backdrop of the
+        new scene. A scene pushed over one that already has a backdrop
+        shares it rather than freezing the scene above the game.
+        """
+        game_state = GameState()
+        if freeze:
+            backdrop = getattr(game_state.scene, "backdrop", None)
+            if backdrop is None:
+                backdrop = snapshot(game_state.screen, darken, blur)
+            scene.backdrop = backdrop
+
+        cls.scenes.append(game_state.scene)
+        game_state.scene = scene
+
+    @classmethod
+    def pop(cls) -> Scene:
+        """Resume the scene below the active one and return the popped scene."""
+        if not cls.scenes:
+            raise RuntimeError("There is no scene to return to.")
+
+        game_state = GameState()
+        popped = game_state.scene
+        game_state.scene = cls.scenes.pop()
+        return popped
+
+    @classmethod
+    def replace(cls, old: Scene, new: Scene):
+        """Put new in place of old, whether old is active or suspended."""
+        game_state = GameState()
+        if game_state.scene is old:
+            game_state.scene = new
+        else:
+            cls.scenes[cls.scenes.index(old)] = new
+
+    @classmethod
+    def clear(cls):
+        """Forget every suspended and cached scene."""
+        cls.scenes.clear()
+        cls.cache.clear()
@@ -0,0 +1,133 @@
+"""Process-wide cache of pre-rasterized shapes."""
+
+import pygame
+
+
+class ShapeCache:
+    """
+    Shared cache of shapes rasterized once into surfaces.
+
+    Each distinct shape, size and color is drawn a single time onto a
+    transparent surface, optionally supersampled for anti-aliasing, and
+    converted to the display format so drawing it is a single blit.
+    """
+
+    shapes: dict = {}
+    hits: int = 0
+    misses: int = 0
+
+    @classmethod
+    def lookup(cls, key: tuple):
+        """Return a cached shape, or None and count a miss."""
+        shape = cls.shapes.get(key)
+        if shape is None:
+            cls.misses += 1
+        else:
+            cls.hits += 1
+        return shape
+
+    @classmethod
+    def finish(cls, surface: pygame.Surface, samples: int) -> pygame.Surface:
+        """Scale a supersampled surface down and convert it."""
+        if samples > 1:
+            width, height = surface.get_size()
+            surface = pygame.transform.smoothscale(
+                surface, (width // samples, height // samples)
+            )
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        return surface
+
+    @classmethod
+    def polygon(
+        cls,
+        points: tuple[tuple[int, int], ...],
+        color: pygame.Color,
+        samples: int = 1,
+    ) -> tuple[pygame.Surface, tuple[int, int]]:
+        """
+        Return a polygon surface and the offset of its top left corner.
+
+        points are relative to the position the polygon is drawn at, so it
+        is blitted at that position plus the offset.
+        """
+        key = ("polygon", points, tuple(color), samples)
+
+        shape = cls.lookup(key)
+        if shape is None:
+            left = min(x for x, _ in points)
+            top = min(y for _, y in points)
+            width = max(x for x, _ in points) - left + 1
+            height = max(y for _, y in points) - top + 1
+            surface = pygame.Surface(
+                (width * samples, height * samples), pygame.SRCALPHA
+            )
+            pygame.draw.polygon(
+                surface,
+                color,
+                [((x - left) * samples, (y - top) * samples) for x, y in points],
+            )
+            shape = cls.shapes[key] = cls.finish(surface, samples), (left, top)
+
+        return shape
+
+    @classmethod
+    def circle(
+        cls,
+        radius: int,
+        color: pygame.Color,
+        width: int = 0,
+        samples: int = 1,
+    ) -> pygame.Surface:
+        """Return a surface holding a circle, or a ring if width is given."""
+        key = ("circle", radius, tuple(color), width, samples)
+
+        surface = cls.lookup(key)
+        if surface is None:
+            size = 2 * radius * samples
+            surface = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.circle(
+                surface, color, (size / 2, size / 2), radius * samples, width * samples
+            )
+            surface = cls.shapes[key] = cls.finish(surface, samples)
+
+        return surface
+
+    @classmethod
+    def rect(
+        cls,
+        size: tuple[int, int],
+        color: pygame.Color,
+        border_radius: int = 0,
+        samples: int = 1,
+    ) -> pygame.Surface:
+        """Return a surface holding a filled, optionally rounded, rect."""
+        key = ("rect", tuple(size), tuple(color), border_radius, samples)
+
+        surface = cls.lookup(key)
+        if surface is None:
+            width, height = size
+            surface = pygame.Surface(
+                (width * samples, height * samples), pygame.SRCALPHA
+            )
+            pygame.draw.rect(
+                surface,
+                color,
+                surface.get_rect(),
+                border_radius=border_radius * samples,
+            )
+            surface = cls.shapes[key] = cls.finish(surface, samples)
+
+        return surface
+
+    @classmethod
+    def stats(cls) -> dict:
+        """Return hit and miss counts along with the current size."""
+        return {"hits": cls.hits, "misses": cls.misses, "size": len(cls.shapes)}
+
+    @classmethod
+    def clear(cls):
+        """Drop every cached shape and reset the counters."""
+        cls.shapes.clear()
+        cls.hits = 0
+        cls.misses = 0
@@ -1,10 +1,18 @@
 """Wrapper for printed text to the screen."""
 
 import time
+import weakref
+from collections.abc import Callable
+from functools import partial
+from itertools import accumulate
+from typing import Any
 
 import pygame
 
+from fonts import FontRegistry
 from gamestate import GameState
+from profiler import profiled
+from renderer import Renderer
 
 
 class TextWrapper:
@@ -21,15 +29,151 @@ class TextWrapper:
         """Initialize TextWrapper."""
         self.text = text
         self.rect = rect
-        self.font = pygame.font.Font(font_name, font_size)
+        self.font = FontRegistry.get(font_name, font_size)
         self.font_height = self.font.size("Tg")[1]
         self.color = color
 
+    @profiled("TextWrapper.draw")
     def draw(self):
         """Draw text."""
+        state = (self.text, self.color, self.font, tuple(self.rect))
+        if Renderer.is_current(self, state):
+            return
+
+        Renderer.erase(self)
         text_surface = self.font.render(self.text, True, self.color)
         game_state = GameState()
-        game_state.screen.blit(text_surface, self.rect)
+        rect = game_state.screen.blit(text_surface, self.rect)
+        Renderer.drawn(
+            self,
+            rect,
+            state,
+            partial(game_state.screen.blit, text_surface, tuple(self.rect)),
+        )
+
+
+class Label(TextWrapper):
+    """
+    Text that is rendered once and re-rendered only when it changes.
+
+    A label can be bound to a source, polled every draw. The text is only
+    formatted when the polled value changes, and only rendered when the
+    formatted text, the color or the font changes.
+    """
+
+    def __init__(
+        self,
+        text: str,
+        rect: pygame.Rect,
+        font_name: str = "freesansbold.ttf",
+        font_size: float = 20,
+        color: pygame.Color = (0, 0, 0),
+        source: Callable[[], Any] = None,
+        formatter: Callable[[Any], str] = str,
+    ):
+        """Initialize Label."""
+        super().__init__(text, rect, font_name, font_size, color)
+        self.source = source
+        self.formatter = formatter
+        self.value = None
+
+        self.surface: pygame.Surface = None
+        self.surface_key = None
+
+    def poll(self):
+        """Update the text from the source if its value changed."""
+        value = self.source()
+        if value != self.value or self.surface_key is None:
+            self.value = value
+            self.text = self.formatter(value)
+
+    def get_surface(self) -> pygame.Surface:
+        """Return the rendered text, rendering it only if it changed."""
+        key = (self.text, tuple(self.color), self.font)
+        if key != self.surface_key:
+            self.surface = self.font.render(self.text, True, self.color)
+            self.surface_key = key
+        return self.surface
+
+    @profiled("Label.draw")
+    def draw(self):
+        """Draw text."""
+        if self.source is not None:
+            self.poll()
+
+        surface = self.get_surface()
+        state = (surface, tuple(self.rect))
+        if Renderer.is_current(self, state):
+            return
+
+        Renderer.erase(self)
+        screen = GameState().screen
+        rect = screen.blit(surface, self.rect)
+        Renderer.drawn(
+            self, rect, state, partial(screen.blit, surface, tuple(self.rect))
+        )
+
+
+class TextLayout:
+    """Line breaking based on cached glyph advances."""
+
+    # Per-font cache of character -> horizontal advance in pixels
+    advances: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def __init__(self, font: pygame.font.Font, text: str, width: float):
+        """Measure the text once and break it into line spans."""
+        self.font = font
+        self.text = text
+        self.width = width
+        self.lines = TextLayout.break_lines(font, text, width)
+
+    def matches(self, font: pygame.font.Font, text: str, width: float) -> bool:
+        """Return whether the layout is still valid for the given inputs."""
+        return self.font is font and self.text == text and self.width == width
+
+    @classmethod
+    def measure(cls, font: pygame.font.Font, text: str) -> list[int]:
+        """Return the advance of every character, measuring unseen glyphs once."""
+        cache = cls.advances.get(font)
+        if cache is None:
+            cache = cls.advances[font] = {}
+
+        missing = "".join(set(text).difference(cache))
+        if missing:
+            for char, metrics in zip(missing, font.metrics(missing)):
+                cache[char] = metrics[4] if metrics is not None else 0
+
+        return [cache[char] for char in text]
+
+    @classmethod
+    def break_lines(
+        cls, font: pygame.font.Font, text: str, width: float
+    ) -> list[tuple[int, int]]:
+        """
+        Return (start, end) spans of each wrapped line.
+
+        A line is broken after the last space that fits, or mid-word when a
+        single word is wider than the line. Runs in linear time.
+        """
+        prefix = list(accumulate(cls.measure(font, text), initial=0))
+
+        lines = []
+        start = 0
+        last_space = -1
+        for i, char in enumerate(text):
+            if char == " ":
+                last_space = i
+
+            if prefix[i + 1] - prefix[start] >= width and i + 1 < len(text):
+                # Keep the trailing space on the line
+                end = last_space + 1 if last_space >= start else max(i, start + 1)
+                lines.append((start, end))
+                start = end
+
+        if start < len(text):
+            lines.append((start, len(text)))
+
+        return lines
 
 
 class DynamicTextWrapper(TextWrapper):
@@ -46,28 +190,85 @@ class DynamicTextWrapper(TextWrapper):
         display_delay: float = 0,
     ):
         """Initialize DynamicTextWrapper."""
-        super().__init__(text, rect, font_name, font_size, color)
+        super().__init__(text, pygame.Rect(rect), font_name, font_size, color)
         self.display_speed = display_speed
         self.display_delay = display_delay
 
         self.display_start = None
+        self.layout: TextLayout = None
 
+        # Revealed text composited so far, reused across frames
+        self.surface: pygame.Surface = None
+        self.surface_key = None
+        self.composited = 0
+        self.composited_height = 0
+
+    def get_layout(self) -> TextLayout:
+        """Return the line layout, rebuilding it if the inputs changed."""
+        if self.layout is None or not self.layout.matches(
+            self.font, self.text, self.rect.width
+        ):
+            self.layout = TextLayout(self.font, self.text, self.rect.width)
+        return self.layout
+
+    def composite(self, characters: int) -> pygame.Surface:
+        """
+        Return the text surface with the first characters revealed.
+
+        Only lines with characters revealed since the last call are
+        rendered. The surface starts over when the text, color, font or size changes.
+        """
+        key = (self.text, tuple(self.color), self.font, self.rect.size)
+        if key != self.surface_key:
+            # Lines may run past the rect by up to a word, as with plain blits
+            widths = [
+                self.font.size(self.text[start:end])[0]
+                for start, end in self.get_layout().lines
+            ]
+            width = max([self.rect.width, *widths])
+            self.surface = pygame.Surface((width, self.rect.height), pygame.SRCALPHA)
+            # Transparent pixels take the text color so blended glyph edges
+            # keep their color
+            self.surface.fill((*key[1][:3], 0))
+            self.surface_key = key
+            self.composited = 0
+            self.composited_height = 0
+
+        if characters <= self.composited:
+            return self.surface
+
+        y = 0
+        lineSpacing = -2
+
+        for start, end in self.get_layout().lines:
+            # determine if the row of text will be outside our area
+            if y + self.font_height > self.rect.height:
+                break
+
+            if start >= characters:
+                break
+
+            # Render only the lines that gained characters. A partial line is
+            # rendered whole so glyphs keep the positions a full render gives
+            # them, and merged with max so what was already there is unchanged
+            end = min(end, characters)
+            if end > self.composited:
+                image = self.font.render(self.text[start:end], True, self.color)
+                self.surface.blit(image, (0, y), special_flags=pygame.BLEND_RGBA_MAX)
+            y += self.font_height + lineSpacing
+
+        self.composited = characters
+        # The last line ends below y by the spacing added after it
+        self.composited_height = y - lineSpacing if y else 0
+        return self.surface
+
+    @profiled("DynamicTextWrapper.draw")
     def draw(self, debug=False):
         """
         Draw dynamic text with wrapping.
 
         Modified from https://www.pygame.org/wiki/TextWrap
         """
-        # Get gamestate
-        game_state = GameState()
-
-        # Draw debug background
-        if debug:
-            debug_surface = pygame.Surface((self.rect.width, self.rect.height))
-            debug_surface.set_alpha(200)
-            debug_surface.fill((255, 255, 255))
-            game_state.screen.blit(debug_surface, (self.rect.x, self.rect.y))
-
         if self.display_start is None:
             self.display_start = time.time()
 
@@ -80,35 +281,33 @@ class DynamicTextWrapper(TextWrapper):
         characters_to_blit = int(time_delta * self.display_speed)
         characters_to_blit = min(characters_to_blit, len(self.text))
 
-        y = self.rect.top
-        lineSpacing = -2
-
-        text = self.text
-        characters_blitted = 0
-        while text:
-            i = 1
-
-            # determine if the row of text will be outside our area
-            if y + self.font_height > self.rect.bottom:
-                break
-
-            # determine maximum width of line
-            while self.font.size(text[:i])[0] < self.rect.width and i < len(text):
-                i += 1
+        state = (
+            self.text,
+            self.color,
+            self.font,
+            tuple(self.rect),
+            characters_to_blit,
+            debug,
+        )
+        if Renderer.is_current(self, state):
+            return
+        Renderer.erase(self)
 
-            # if we've wrapped the text, then adjust the wrap to the last word
-            if i < len(text):
-                i = text.rfind(" ", 0, i) + 1
+        # Get gamestate
+        game_state = GameState()
+        drawn_rect = pygame.Rect(self.rect.topleft, (0, 0))
+        blits = []
 
-            # Correct if the line is more than should be blitted
-            if characters_blitted + i > characters_to_blit:
-                i = characters_to_blit - characters_blitted
+        # Draw debug background
+        if debug:
+            debug_surface = pygame.Surface((self.rect.width, self.rect.height))
+            debug_surface.set_alpha(200)
+            debug_surface.fill((255, 255, 255))
+            blits.append((debug_surface, self.rect.topleft))
 
-            # render the line and blit it to the surface
-            image = self.font.render(text[:i], True, self.color)
-            game_state.screen.blit(image, (self.rect.left, y))
-            y += self.font_height + lineSpacing
+        surface = self.composite(characters_to_blit)
+        area = pygame.Rect(0, 0, surface.get_width(), self.composited_height)
+        blits.append((surface, self.rect.topleft, area))
 
-            # remove the text we just blitted
-            text = text[i:]
-            characters_blitted += i
+        drawn_rect.unionall_ip(game_state.screen.blits(blits))
+        Renderer.drawn(self, drawn_rect, state, partial(game_state.screen.blits, blits))
@@ -0,0 +1,32 @@
+"""Fixed timestep simulation clock."""
+
+from typing import Callable
+
+
+class FixedTimestep:
+    """
+    Run simulation updates in fixed steps regardless of the frame rate.
+
+    Frame time is accumulated and consumed in whole steps. The leftover
+    fraction of a step is kept in alpha so drawing can interpolate between
+    the previous and current simulation states.
+    """
+
+    def __init__(self, step: float = 1 / 60, max_steps: int = 5):
+        """Initialize FixedTimestep."""
+        self.step = step
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.alpha = 1.0
+
+    def advance(self, frame_time: float, update: Callable[[float], None]):
+        """Call update once for every whole step covered by frame_time."""
+        # Drop time beyond max_steps so a long stall can't snowball
+        self.accumulator = min(
+            self.accumulator + frame_time, self.step * self.max_steps
+        )
+        while self.accumulator >= self.step:
+            update(self.step)
+            self.accumulator -= self.step
+
+        self.alpha = self.accumulator / self.step
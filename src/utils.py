@@ -4,14 +4,189 @@ Utilities.
 Various util functions used throughout the codebase.
 """
 
+import hashlib
 import json
+import marshal
+import os
 import re
+import threading
+from collections.abc import Iterator, Mapping
+
+# Bump when the layout of compiled caches changes
+CACHE_VERSION = 2
+
+# Runs of json text (strings included whole) or a comment. Matching strings
+# inside the runs means comment markers within them are left alone
+JSONC_TOKENS = re.compile(
+    r'((?:[^"/]+|"(?:[^"\\\n]|\\.)*"|/(?![/*]))+)|//[^\n]*|/\*.*?\*/',
+    flags=re.DOTALL,
+)
+JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+def strip_jsonc(text: str) -> str:
+    """Return jsonc text with its comments removed, in a single pass."""
+    runs = []
+    end = 0
+    for match in JSONC_TOKENS.finditer(text):
+        # Tokens cover all valid text, so a gap starts an unterminated
+        # string or comment
+        if match.start() != end:
+            break
+        # Comments become a space so the tokens around them stay separated
+        runs.append(match.group(1) or "")
+        end = match.end()
+
+    if end != len(text):
+        raise ValueError(f"Unterminated string or comment at offset {end}.")
+    return " ".join(runs)
 
 
 def load_jsonc(filepath: str) -> dict:
     """Return a dict as parsed from a json or jsonc file."""
     with open(filepath) as f:
-        file_contents = f.read()
-        file_contents = re.sub(r"\/\/.*", "", file_contents)
-        file_contents = re.sub(r"\/\*.*\*\/", "", file_contents, flags=re.DOTALL)
-        return json.loads(file_contents)
+        return json.loads(strip_jsonc(f.read()))
+
+
+class JsoncDocument(Mapping):
+    """Read only mapping that decodes each top level value on first access."""
+
+    def __init__(self, sources: dict[str, str]):
+        """Initialize from the json source of every top level value."""
+        self.sources = sources
+        self.values = {}
+
+    def __getitem__(self, key: str):
+        """Decode and return a value."""
+        if key not in self.values:
+            self.values[key] = json.loads(self.sources[key])
+        return self.values[key]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the keys."""
+        return iter(self.sources)
+
+    def __len__(self) -> int:
+        """Return the number of keys."""
+        return len(self.sources)
+
+
+def index_jsonc(filepath: str) -> dict[str, str]:
+    """
+    Return the json source of every value in a jsonc file's top level object.
+
+    Values are only scanned to find where they end, not kept, so they can
+    be decoded individually later.
+    """
+    with open(filepath) as f:
+        text = strip_jsonc(f.read())
+
+    decoder = json.JSONDecoder()
+    sources = {}
+
+    i = JSON_WHITESPACE.match(text).end()
+    if not text.startswith("{", i):
+        raise ValueError(f'"{filepath}" does not contain a json object.')
+    i = JSON_WHITESPACE.match(text, i + 1).end()
+
+    while not text.startswith("}", i):
+        key, i = json.decoder.scanstring(text, i + 1)
+        i = JSON_WHITESPACE.match(text, i).end()
+        if not text.startswith(":", i):
+            raise ValueError(f'Expected ":" after "{key}" in "{filepath}".')
+
+        start = JSON_WHITESPACE.match(text, i + 1).end()
+        _, end = decoder.raw_decode(text, start)
+        sources[key] = text[start:end]
+
+        i = JSON_WHITESPACE.match(text, end).end()
+        if text.startswith(",", i):
+            i = JSON_WHITESPACE.match(text, i + 1).end()
+
+    return sources
+
+
+def load_jsonc_lazy(filepath: str) -> JsoncDocument:
+    """Return a mapping of a jsonc file that decodes values on access."""
+    return JsoncDocument(index_jsonc(filepath))
+
+
+def get_cache_path(filepath: str) -> str:
+    """Return the path of the compiled cache for a data file."""
+    directory, filename = os.path.split(filepath)
+    return os.path.join(directory, "__pycache__", f"{filename}.marshal")
+
+
+def read_cache(filepath: str, mtime_ns: int, size: int) -> tuple:
+    """
+    Return the (header, data) stored in the cache for a data file.
+
+    data is None when the cache is missing or was built from a file with a
+    different mtime or size. The header is still returned when possible so
+    the caller can compare content hashes.
+    """
+    try:
+        with open(get_cache_path(filepath), "rb") as f:
+            header = marshal.load(f)
+            if header[:3] == (CACHE_VERSION, mtime_ns, size):
+                return header, marshal.load(f)
+            return header, None
+    except (OSError, EOFError, ValueError, TypeError):
+        return None, None
+
+
+def write_cache(filepath: str, header: tuple, data):
+    """Atomically write the compiled cache for a data file."""
+    cache_path = get_cache_path(filepath)
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(temp_path, "wb") as f:
+            marshal.dump(header, f)
+            marshal.dump(data, f)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        # A read only install still works, it just parses every time
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def write_atomic(filepath: str, data: bytes):
+    """Write a file so that readers only ever see the old or the new contents."""
+    temp_path = f"{filepath}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, filepath)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def load_jsonc_cached(filepath: str) -> JsoncDocument:
+    """
+    Return a lazily decoded mapping of a jsonc file, using a compiled cache.
+
+    The cache holds the json source of each top level value, so loading it
+    skips scanning and each value is decoded only when it is accessed. The
+    cache is trusted while the source mtime and size match. Otherwise the
+    source is hashed and only re-scanned if its contents changed.
+    """
+    stat = os.stat(filepath)
+    header, data = read_cache(filepath, stat.st_mtime_ns, stat.st_size)
+    if data is not None:
+        return JsoncDocument(data)
+
+    with open(filepath, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+
+    if header is not None and header[0] == CACHE_VERSION and header[3] == digest:
+        # Only the mtime changed, so the cached data is still valid
+        with open(get_cache_path(filepath), "rb") as f:
+            marshal.load(f)
+            data = marshal.load(f)
+    else:
+        data = index_jsonc(filepath)
+
+    write_cache(filepath, (CACHE_VERSION, stat.st_mtime_ns, stat.st_size, digest), data)
+    return JsoncDocument(data)
@@ -0,0 +1,63 @@
+"""Shared fixtures for the tests."""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # noqa: E402
+import pytest  # noqa: E402
+
+from fonts import FontRegistry  # noqa: E402
+from gamestate import GameState  # noqa: E402
+from parts import Part, Title  # noqa: E402
+
+PARTS_JSONC = """{
+    // Part templates for the tests
+    "torso": {"cost": 90, "sockets": {"female": 2, "male": 0}, "slots": 2},
+    "arm": {"cost": 30, "sockets": {"female": 1, "male": 1}, "slots": 1}
+}
+"""
+
+TITLES_JSONC = """{
+    "strong": {
+        "effects": [
+            {"scaling": "proportional", "attack": 1.5},
+            {"scaling": "static", "health": 5}
+        ]
+    },
+    "sturdy": {
+        "effects": [
+            {"scaling": "static", "defense": 3},
+            {"scaling": "proportional", "health": 1.1, "defense": 2}
+        ]
+    }
+}
+"""
+
+
+@pytest.fixture
+def screen() -> pygame.Surface:
+    """Open a headless screen and set it on the game state."""
+    pygame.init()
+    game_state = GameState()
+    game_state.screen = pygame.display.set_mode((1280, 720))
+    yield game_state.screen
+    # Fonts do not survive pygame.quit
+    FontRegistry.clear()
+    pygame.quit()
+
+
+@pytest.fixture
+def game_data(tmp_path, monkeypatch):
+    """Run in a directory with the test part and title templates."""
+    data = tmp_path / "data"
+    data.mkdir()
+    (data / "parts.jsonc").write_text(PARTS_JSONC)
+    (data / "titles.jsonc").write_text(TITLES_JSONC)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(Part, "parts_data", None)
+    monkeypatch.setattr(Title, "titles_data", None)
+    monkeypatch.setattr(Title, "titles", {})
+    monkeypatch.setattr(Title, "chains", {})
+    return tmp_path
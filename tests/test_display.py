@@ -0,0 +1,51 @@
+"""Tests for drawing at a reduced internal resolution."""
+
+import pygame
+import pytest
+
+from display import Canvas
+
+
+@pytest.mark.parametrize("scale", [0.5, 0.75])
+def test_rects_cover_each_other(screen: pygame.Surface, scale: float):
+    """Internal rects cover logical rects and map back over them."""
+    canvas = Canvas((1280, 720), scale)
+    rect = pygame.Rect(101, 33, 57, 9)
+    internal = canvas.to_internal(rect)
+    assert canvas.to_logical(internal).contains(rect)
+    assert canvas.to_logical(internal).width <= rect.width + 2 / scale
+
+
+def test_whole_surfaces_are_scaled_once(screen: pygame.Surface):
+    """Blitting a surface whole reuses its scaled copy."""
+    canvas = Canvas((1280, 720), 0.5)
+    source = pygame.Surface((40, 20))
+    source.fill((255, 0, 0))
+
+    rect = canvas.blit(source, (100, 50))
+    scaled = canvas.scaled[source]
+    canvas.blit(source, (200, 50))
+    assert canvas.scaled[source] is scaled
+    assert rect == pygame.Rect(100, 50, 40, 20)
+    assert canvas.surface.get_at((60, 30)) == (255, 0, 0)
+
+
+def test_areas_draw_like_whole_surfaces(screen: pygame.Surface):
+    """An area of a surface draws its part of the whole scaled surface."""
+    canvas = Canvas((1280, 720), 0.5)
+    source = pygame.Surface((40, 20))
+    source.fill((0, 0, 255))
+    source.fill((0, 255, 0), pygame.Rect(20, 0, 20, 20))
+
+    canvas.blit(source, (0, 0), pygame.Rect(20, 0, 20, 20))
+    assert canvas.surface.get_at((5, 5)) == (0, 255, 0)
+    canvas.blit(source, (0, 0))
+    canvas.blit(source, (100, 0), pygame.Rect(20, 0, 20, 20))
+    assert canvas.surface.get_at((55, 5)) == (0, 255, 0)
+
+
+def test_empty_surfaces_draw_nothing(screen: pygame.Surface):
+    """Empty surfaces and areas are skipped rather than scaled."""
+    canvas = Canvas((1280, 720), 0.5)
+    assert not canvas.blit(pygame.Surface((0, 30)), (10, 10))
+    assert not canvas.blit(pygame.Surface((30, 30)), (10, 10), pygame.Rect(0, 0, 0, 5))
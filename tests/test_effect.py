@@ -0,0 +1,75 @@
+"""Tests for effects and their folding into affine effects."""
+
+from array import array
+
+import pytest
+
+from effect import AffineEffect, Effect, ProportionalEffect, StaticEffect
+from parts import Title
+
+STATS = [(10, 4, 7), (0, 0, 0), (-3.5, 12.25, 1e6)]
+CHAIN = [
+    StaticEffect(5, -1, 2),
+    ProportionalEffect(1.5, 2, 0.5),
+    AffineEffect(2, 3, 4, 1, -2, 0.5),
+    StaticEffect(-4, 0, 3),
+    ProportionalEffect(0.9, 1.1, 1),
+]
+
+
+def apply_each(effects: list[Effect], stats: tuple) -> tuple:
+    """Return stats with every effect applied in order."""
+    for effect in effects:
+        stats = effect.apply(*stats)
+    return stats
+
+
+@pytest.mark.parametrize("stats", STATS)
+def test_compile_matches_applying_each_effect(stats: tuple):
+    """A compiled chain applies like its effects one after another."""
+    compiled = AffineEffect.compile(CHAIN)
+    assert compiled.apply(*stats) == pytest.approx(apply_each(CHAIN, stats))
+
+
+@pytest.mark.parametrize("stats", STATS)
+def test_then_folds_in_order(stats: tuple):
+    """Folding with then keeps the order effects are applied in."""
+    first = AffineEffect.compile(CHAIN[:2])
+    second = AffineEffect.compile(CHAIN[2:])
+    assert first.then(second).apply(*stats) == pytest.approx(apply_each(CHAIN, stats))
+
+
+def test_empty_chain_is_identity():
+    """Compiling no effects leaves stats unchanged."""
+    assert AffineEffect.compile([]).apply(3, 4, 5) == (3, 4, 5)
+
+
+def test_compile_rejects_unknown_effects():
+    """Effects that are not affine cannot be folded."""
+
+    class SquareEffect(Effect):
+        def apply(self, health: float, defense: float, attack: float):
+            return health**2, defense**2, attack**2
+
+    with pytest.raises(TypeError, match="SquareEffect"):
+        AffineEffect.compile([SquareEffect(0, 0, 0)])
+
+
+def test_apply_batch_matches_apply():
+    """Batches apply like each set of stats on its own."""
+    compiled = AffineEffect.compile(CHAIN)
+    columns = [array("d", column) for column in zip(*STATS)]
+    batch = list(zip(*compiled.apply_batch(*columns)))
+    assert batch == [compiled.apply(*stats) for stats in STATS]
+
+
+def test_title_chains_fold_and_cache(game_data):
+    """Title chains apply like their effects and are compiled once."""
+    titles = (Title.get("strong"), Title.get("sturdy"))
+    effects = [effect for title in titles for effect in title.effects]
+
+    chain = Title.compile_chain(titles)
+    assert Title.compile_chain(list(titles)) is chain
+    assert Title.compile_chain(titles[::-1]) is not chain
+    for stats in STATS:
+        assert chain.apply(*stats) == pytest.approx(apply_each(effects, stats))
@@ -0,0 +1,43 @@
+"""Tests for mouse hit testing."""
+
+import pygame
+
+from hittest import HitTester
+
+
+def register_and_click(tester: HitTester, clicks: list):
+    """Register a button for the current scene and queue a click on it."""
+    tester.register_rect(
+        "button", pygame.Rect(0, 0, 100, 100), lambda: clicks.append("button")
+    )
+    tester.handle_event(
+        pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(50, 50), button=1)
+    )
+
+
+def test_click_reaches_target_of_active_scene(screen: pygame.Surface):
+    """A target registered for the active scene takes its clicks."""
+    tester = HitTester()
+    scene = object()
+    clicks = []
+
+    tester.set_scene(scene)
+    register_and_click(tester, clicks)
+    tester.set_scene(scene)
+    tester.update()
+
+    assert clicks == ["button"]
+
+
+def test_scene_change_drops_targets(screen: pygame.Surface):
+    """Targets of a scene that is no longer active take no clicks."""
+    tester = HitTester()
+    clicks = []
+
+    tester.set_scene(object())
+    register_and_click(tester, clicks)
+    tester.set_scene(object())
+    tester.update()
+
+    assert clicks == []
+    assert not tester.is_hovered("button")
@@ -0,0 +1,28 @@
+"""Tests for buffered keyboard input."""
+
+import pygame
+
+from inputcontroller import InputController
+
+
+def key_event(event_type: int, key: int) -> pygame.event.Event:
+    """Return a key event."""
+    return pygame.event.Event(event_type, key=key, mod=0)
+
+
+def test_overflow_keeps_release_of_held_key(screen: pygame.Surface):
+    """A release is kept when a frame brings more events than the buffer holds."""
+    controller = InputController(buffer_size=4)
+    controller.handle_event(key_event(pygame.KEYDOWN, pygame.K_UP))
+    controller.update()
+    assert controller.held("up")
+
+    controller.handle_event(key_event(pygame.KEYUP, pygame.K_UP))
+    for _ in range(10):
+        controller.handle_event(key_event(pygame.KEYDOWN, pygame.K_a))
+        controller.handle_event(key_event(pygame.KEYUP, pygame.K_a))
+    controller.update()
+
+    assert not controller.held("up")
+    assert controller.released("up")
+    assert not controller.held("left")
@@ -0,0 +1,97 @@
+"""Tests for array-backed part storage."""
+
+import random
+
+import pytest
+
+from monster import Monster
+from parts import Part
+from partstore import PartStore
+from savefile import load_save, snapshot, write_save
+
+
+def make_store() -> PartStore:
+    """Return a store with a torso and two arms."""
+    store = PartStore()
+    rng = random.Random(0)
+    store.factory_natural_batch("torso", 1, rng=rng)
+    store.factory_natural_batch("arm", 2, ("strong",), rng)
+    return store
+
+
+def test_views_compare_by_part(game_data):
+    """Views of the same part are equal and hash alike."""
+    store = make_store()
+    assert store[1] == store[1]
+    assert store[1] == store[-2]
+    assert store[1] != store[2]
+    assert store[1] != object()
+    assert len({store[0], store[1], store[1]}) == 2
+
+
+def test_monster_of_views(game_data):
+    """Monsters accept any view of their parts."""
+    store = make_store()
+    monster = Monster(store[0])
+    monster.attach(store[0], store[1])
+    monster.attach(store[1], store[2])
+
+    assert store[1] in monster
+    assert len(monster) == 3
+    assert monster.detach(store[1]) == [store[1], store[2]]
+    assert store[1] not in monster
+    assert store[0].female_sockets == ()
+    assert store[1].female_sockets == [store[2]]
+
+
+def test_save_views(game_data, tmp_path):
+    """A save of views loads back as equal parts and monsters."""
+    store = make_store()
+    monster = Monster(store[0])
+    monster.attach(store[0], store[1])
+    monster.attach(store[1], store[2])
+
+    path = tmp_path / "views.sav"
+    write_save(path, snapshot(store, [monster]))
+    parts, monsters = load_save(path)
+
+    for view, part in zip(store, parts):
+        assert part.template_name == view.template_name
+        assert (part.health, part.defense, part.attack) == (
+            view.health,
+            view.defense,
+            view.attack,
+        )
+        assert part.titles == view.titles
+    assert len(monsters) == 1
+    assert monsters[0].root is parts[0]
+    assert len(monsters[0]) == 3
+    assert monsters[0].health == monster.health
+
+
+@pytest.mark.parametrize("titles", [(), ("strong",), ("sturdy", "strong")])
+def test_batch_matches_factory_natural(game_data, titles: tuple[str, ...]):
+    """Batch generated parts equal parts from Part.factory_natural."""
+    random.seed(7)
+    parts = [Part.factory_natural("arm", titles) for _ in range(20)]
+    store = PartStore()
+    random.seed(7)
+    store.factory_natural_batch("arm", 20, titles)
+
+    for part, view in zip(parts, store):
+        assert (view.health, view.defense, view.attack) == pytest.approx(
+            (part.health, part.defense, part.attack)
+        )
+        assert (
+            view.health_max,
+            view.female_sockets_max,
+            view.male_sockets_max,
+            view.slots_max,
+        ) == (
+            part.health_max,
+            part.female_sockets_max,
+            part.male_sockets_max,
+            part.slots_max,
+        )
+        assert view.titles == part.titles
+        assert view.template_name == part.template_name
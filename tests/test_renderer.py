@@ -0,0 +1,35 @@
+"""Tests for the dirty rectangle renderer."""
+
+import pygame
+
+from renderer import Renderer
+from scenes.scene import Scene
+from text import Label
+
+
+class WhiteScene(Scene):
+    """Scene with a plain white background."""
+
+    background_color = (255, 255, 255)
+
+
+def test_erase_redraws_objects_drawn_this_frame(screen: pygame.Surface):
+    """Erasing over an object drawn earlier in the frame keeps it on screen."""
+    below = Label("below", pygame.Rect(100, 100, 200, 30))
+    moving = Label("moving", pygame.Rect(110, 105, 200, 30))
+
+    Renderer.begin(WhiteScene())
+    below.draw()
+    moving.draw()
+    Renderer.present()
+
+    # below is kept as it is, then moving erases its old rect over it
+    below.draw()
+    moving.rect = pygame.Rect(400, 400, 200, 30)
+    moving.draw()
+
+    expected = pygame.Surface(below.rect.size)
+    expected.fill(WhiteScene.background_color)
+    expected.blit(below.get_surface(), (0, 0))
+    drawn = screen.subsurface(below.rect)
+    assert pygame.image.tobytes(drawn, "RGB") == pygame.image.tobytes(expected, "RGB")
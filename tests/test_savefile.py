@@ -0,0 +1,139 @@
+"""Tests for the binary save format."""
+
+import pytest
+
+from monster import Monster
+from parts import Part, Title
+from savefile import Autosaver, SaveReader, load_save, serialize, snapshot, write_save
+
+
+def make_parts() -> tuple[list[Part], Monster]:
+    """Return parts, with slots and titles, and a monster of some of them."""
+    torso = Part.factory_natural("torso", ("sturdy",))
+    left = Part.factory_natural("arm", ("strong", "sturdy"))
+    right = Part.factory_natural("arm")
+    hand = Part.factory_natural("arm", ("strong",))
+    loose = Part(10, 2, 3, 0, 1, 0, 1, (Title.get("strong"),))
+    torso.slots.extend(["gem", "rune"])
+    left.slots.append("gem")
+
+    monster = Monster(torso)
+    monster.attach(torso, left)
+    monster.attach(torso, right)
+    monster.attach(left, hand)
+    monster.apply_effect(hand, Title.get("strong").effects[0])
+    return [torso, left, right, hand, loose], monster
+
+
+def part_fields(part: Part) -> tuple:
+    """Return the saved fields of a part."""
+    return (
+        part.template_name,
+        part.health,
+        part.health_max,
+        part.defense,
+        part.attack,
+        part.female_sockets_max,
+        part.male_sockets_max,
+        part.slots_max,
+        tuple(title.name for title in part.titles),
+        list(part.slots),
+    )
+
+
+def test_round_trip(game_data, tmp_path):
+    """Parts, their links and slots, and monsters load back equal."""
+    parts, monster = make_parts()
+    path = tmp_path / "game.sav"
+    write_save(path, snapshot(parts, [monster]))
+
+    loaded, monsters = load_save(path)
+    assert list(map(part_fields, loaded)) == list(map(part_fields, parts))
+
+    index = {part: i for i, part in enumerate(parts)}
+    loaded_index = {part: i for i, part in enumerate(loaded)}
+    for part, loaded_part in zip(parts, loaded):
+        assert [index[p] for p in part.female_sockets] == [
+            loaded_index[p] for p in loaded_part.female_sockets
+        ]
+        assert [index[p] for p in part.male_sockets] == [
+            loaded_index[p] for p in loaded_part.male_sockets
+        ]
+
+    (loaded_monster,) = monsters
+    assert loaded_monster.root is loaded[0]
+    assert {loaded_index[p] for p in loaded_monster} == {index[p] for p in monster}
+    assert (
+        loaded_monster.health,
+        loaded_monster.health_max,
+        loaded_monster.defense,
+        loaded_monster.attack,
+    ) == pytest.approx(
+        (monster.health, monster.health_max, monster.defense, monster.attack)
+    )
+
+
+def test_snapshot_is_unaffected_by_later_changes(game_data):
+    """Changes after a snapshot do not reach the save."""
+    parts, monster = make_parts()
+    save = snapshot(parts, [monster])
+    data = serialize(save)
+
+    parts[0].health = 0
+    parts[0].slots.append("late")
+    monster.detach(parts[1])
+    assert serialize(save) == data
+
+
+def test_attached_parts_must_be_saved(game_data):
+    """A monster whose parts are not all saved cannot be serialized."""
+    parts, monster = make_parts()
+    with pytest.raises(ValueError, match="attached part"):
+        serialize(snapshot(parts[:2], [monster]))
+
+
+def test_reader_streams_small_chunks(game_data, tmp_path):
+    """Records read the same however small the decompressed chunks are."""
+    parts, monster = make_parts()
+    path = tmp_path / "game.sav"
+    write_save(path, snapshot(parts, [monster]))
+
+    with SaveReader(path) as reader:
+        whole = list(reader.parts()), list(reader.monster_roots())
+    with SaveReader(path, chunk_size=7) as reader:
+        assert (list(reader.parts()), list(reader.monster_roots())) == whole
+
+
+@pytest.mark.parametrize("data", [b"", b"NOPE" + bytes(14)])
+def test_rejects_other_files(tmp_path, data: bytes):
+    """Files that are not saves are rejected."""
+    path = tmp_path / "other.sav"
+    path.write_bytes(data)
+    with pytest.raises(ValueError, match="save file"):
+        load_save(path)
+
+
+def test_rejects_truncated_saves(game_data, tmp_path):
+    """A save cut short is rejected rather than read partially."""
+    parts, monster = make_parts()
+    data = serialize(snapshot(parts, [monster]))
+    path = tmp_path / "cut.sav"
+    path.write_bytes(data[:-8])
+    with pytest.raises(ValueError, match="truncated"):
+        load_save(path)
+
+
+def test_autosaver_saves_after_interval(game_data, tmp_path):
+    """The autosaver writes once its interval has passed."""
+    parts, monster = make_parts()
+    path = tmp_path / "auto.sav"
+    autosaver = Autosaver(str(path), interval=10)
+
+    autosaver.update(5, parts, [monster])
+    assert autosaver.future is None
+    autosaver.update(5, parts, [monster])
+    autosaver.close()
+
+    loaded, monsters = load_save(path)
+    assert len(loaded) == len(parts)
+    assert len(monsters[0]) == len(monster)
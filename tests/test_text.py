@@ -0,0 +1,16 @@
+"""Tests for text drawing."""
+
+import pygame
+
+from renderer import Renderer
+from text import DynamicTextWrapper
+
+
+def test_dynamic_text_draws_empty_text(screen: pygame.Surface):
+    """Drawing empty text draws nothing and does not fail."""
+    Renderer.invalidate()
+    wrapper = DynamicTextWrapper("", pygame.Rect(10, 10, 200, 100))
+    wrapper.draw()
+
+    assert wrapper.composited_height == 0
+    assert wrapper.surface.get_width() == 200
@@ -0,0 +1,87 @@
+"""Tests for the jsonc utilities."""
+
+import json
+
+import pytest
+
+from utils import index_jsonc, load_jsonc_cached, load_jsonc_lazy, strip_jsonc
+
+
+def test_strip_jsonc_removes_comments():
+    """Line and block comments are removed."""
+    text = '{\n  // line\n  "a": 1, /* block\n spanning lines */ "b": [2]\n}'
+    assert json.loads(strip_jsonc(text)) == {"a": 1, "b": [2]}
+
+
+def test_strip_jsonc_keeps_comment_markers_in_strings():
+    """Comment markers and escaped quotes inside strings are left alone."""
+    text = r'{"url": "http://x/*y*/", "quote": "say \"//hi\"", "path": "a/b"}'
+    assert json.loads(strip_jsonc(text)) == {
+        "url": "http://x/*y*/",
+        "quote": 'say "//hi"',
+        "path": "a/b",
+    }
+
+
+def test_strip_jsonc_separates_tokens_around_comments():
+    """A comment between two tokens still separates them."""
+    assert strip_jsonc("1/**/2").split() == ["1", "2"]
+
+
+@pytest.mark.parametrize(
+    "text, offset",
+    [
+        ('{"a": "unterminated}', 6),
+        ('{"a": 1} /* open', 9),
+        ('{"a": "line\nbreak"}', 6),
+    ],
+)
+def test_strip_jsonc_rejects_unterminated_input(text: str, offset: int):
+    """An unterminated string or comment raises with its offset."""
+    with pytest.raises(ValueError, match=f"offset {offset}"):
+        strip_jsonc(text)
+
+
+def test_index_jsonc_splits_top_level_values(tmp_path):
+    """Each top level value is kept as its own json source."""
+    path = tmp_path / "data.jsonc"
+    path.write_text(
+        '{\n  // parts\n  "arm": {"cost": 30, "note": "a // b"},\n'
+        '  "tags": ["x", "y"] /* trailing */\n}\n'
+    )
+
+    sources = index_jsonc(path)
+    assert list(sources) == ["arm", "tags"]
+    assert json.loads(sources["arm"]) == {"cost": 30, "note": "a // b"}
+    assert json.loads(sources["tags"]) == ["x", "y"]
+
+
+def test_index_jsonc_requires_an_object(tmp_path):
+    """A file without a top level object is rejected."""
+    path = tmp_path / "data.jsonc"
+    path.write_text("[1, 2]")
+    with pytest.raises(ValueError, match="json object"):
+        index_jsonc(path)
+
+
+def test_load_jsonc_lazy_decodes_on_access(tmp_path):
+    """Values are only decoded when they are accessed."""
+    path = tmp_path / "data.jsonc"
+    path.write_text('{"a": {"b": 1}, "c": 2}')
+
+    document = load_jsonc_lazy(path)
+    assert len(document) == 2
+    assert document.values == {}
+    assert document["a"] == {"b": 1}
+    assert list(document.values) == ["a"]
+
+
+def test_load_jsonc_cached_follows_changes(tmp_path):
+    """A cached file is scanned again once its contents change."""
+    path = tmp_path / "data.jsonc"
+    path.write_text('{"a": 1}')
+    assert dict(load_jsonc_cached(str(path))) == {"a": 1}
+    assert (tmp_path / "__pycache__" / "data.jsonc.marshal").exists()
+
+    path.write_text('{"a": 2, "b": 3} // changed')
+    assert dict(load_jsonc_cached(str(path))) == {"a": 2, "b": 3}